@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 _DATA_DIR = Path(__file__).parent / "data"
 
@@ -46,17 +47,26 @@ def get_target_date() -> str:
     raise FileNotFoundError("No data available (set TARGET_DATE or ensure manifest exists)")
 
 
-def load_parquet(name: str, target_date: str | None = None) -> pd.DataFrame:
+def load_parquet(
+    name: str,
+    target_date: str | None = None,
+    columns: list[str] | None = None,
+    filters=None,
+) -> pd.DataFrame:
     """Load a parquet file from the data directory.
 
+    The file is memory-mapped and only the requested columns are decoded.
+
     Args:
         name: Dataset name (without .parquet extension)
         target_date: YYYY-MM-DD format, or None to auto-detect
+        columns: Columns to read, or None for all
+        filters: pyarrow filter expression or DNF list, pushed down to row groups
 
     Raises:
         FileNotFoundError: If data doesn't exist
     """
-    import pandas as pd
+    import pyarrow.parquet as pq
 
     data_root = _get_data_root()
 
@@ -67,7 +77,88 @@ def load_parquet(name: str, target_date: str | None = None) -> pd.DataFrame:
     if not parquet_path.exists():
         raise FileNotFoundError(f"Data not found: {parquet_path}")
 
-    return pd.read_parquet(parquet_path)
+    table = pq.read_table(
+        parquet_path, columns=columns, filters=filters, memory_map=True
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_dataset(
+    name: str,
+    dates: list[str] | None = None,
+    columns: list[str] | None = None,
+    filter=None,
+) -> pd.DataFrame:
+    """Load a dataset across several dates as one DataFrame.
+
+    The per-date files (<date>/<name>.parquet) are opened as a single pyarrow
+    dataset partitioned by directory, with the directory name exposed as a
+    string ``date`` column. Column projection and ``filter`` are pushed down
+    to the Parquet row groups.
+
+    Args:
+        name: Dataset name (without .parquet extension)
+        dates: YYYY-MM-DD dates to include, or None for every date on disk
+        columns: Columns to read (``date`` included), or None for all
+        filter: pyarrow compute expression, e.g. ``pc.field("slot") > 100``
+
+    Raises:
+        FileNotFoundError: If no data exists for the dataset
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    data_root = _get_data_root()
+
+    if dates is None:
+        paths = sorted(data_root.glob(f"*/{name}.parquet"))
+    else:
+        paths = [data_root / date / f"{name}.parquet" for date in dates]
+        paths = [path for path in paths if path.exists()]
+    if not paths:
+        raise FileNotFoundError(f"Data not found: {name}")
+
+    dataset = ds.dataset(
+        [str(path) for path in paths],
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("date", pa.string())])),
+        partition_base_dir=str(data_root),
+    )
+    table = dataset.to_table(columns=columns, filter=filter)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_arrow(name: str, target_date: str | None = None) -> pa.Table:
+    """Memory-map the Arrow IPC copy of a dataset.
+
+    Zero-copy: buffers are backed by the mapped file, so nothing is decoded
+    until accessed. Falls back to reading the Parquet file if no .arrow copy
+    exists (e.g. data fetched before it was written).
+
+    Args:
+        name: Dataset name (without extension)
+        target_date: YYYY-MM-DD format, or None to auto-detect
+
+    Raises:
+        FileNotFoundError: If data doesn't exist
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    data_root = _get_data_root()
+
+    if target_date is None:
+        target_date = get_target_date()
+
+    arrow_path = data_root / target_date / f"{name}.arrow"
+    if arrow_path.exists():
+        source = pa.memory_map(str(arrow_path), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    parquet_path = arrow_path.with_suffix(".parquet")
+    if not parquet_path.exists():
+        raise FileNotFoundError(f"Data not found: {parquet_path}")
+    return pq.read_table(parquet_path, memory_map=True)
 
 
 def get_parquet_sql(name: str, target_date: str | None = None) -> str | None:
@@ -1,15 +1,17 @@
 """
 Fetch functions for blob flow analysis.
 
-Each function executes SQL and returns the DataFrame and query string.
+Each function executes SQL and returns an Arrow record batch stream and the
+query string. Output DateTime columns are cast to DateTime64 because
+ClickHouse's Arrow format sends plain DateTime as UInt32.
 """
 
 from pathlib import Path
 
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_blob_flow(
@@ -19,9 +21,9 @@ def fetch_blob_flow(
 ) -> tuple:
     """Fetch proposer blobs with MEV relay data.
 
-    Returns (df, query).
+    Returns (stream, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 WITH blocks AS (
@@ -34,41 +36,42 @@ WITH blocks AS (
         meta_network_name
     FROM canonical_beacon_block
     WHERE
-        meta_network_name = '{network}'
+        meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 blobs AS (
     SELECT
         slot,
         block_root,
-        count(DISTINCT blob_index) AS blob_count
+        -- blob_index is bounded (< 64), so an OR-ed bitset dedups without hash-set state
+        bitCount(groupBitOr(bitShiftLeft(toUInt64(1), toUInt8(blob_index)))) AS blob_count
     FROM canonical_beacon_blob_sidecar
     WHERE
-        meta_network_name = '{network}'
+        meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot, block_root
 ),
 mev AS (
     SELECT
         slot,
-        -- Use max() for deterministic selection when multiple relays deliver same slot
-        max(builder_pubkey) AS builder_pubkey,
-        max(relay_name) AS relay_name
+        -- Take the latest delivery when multiple relays deliver the same slot
+        argMax(builder_pubkey, event_date_time) AS builder_pubkey,
+        argMax(relay_name, event_date_time) AS relay_name
     FROM mev_relay_proposer_payload_delivered
     WHERE
-        meta_network_name = '{network}'
+        meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot
 )
 SELECT
     b.slot,
     b.epoch,
-    b.slot_start_date_time,
+    toDateTime64(b.slot_start_date_time, 0) AS slot_start_date_time,
     b.proposer_index,
-    e.entity AS proposer_entity,
+    toLowCardinality(e.entity) AS proposer_entity,
     coalesce(bl.blob_count, 0) AS blob_count,
-    m.builder_pubkey AS winning_builder_pubkey,
-    m.relay_name AS winning_relay
+    toLowCardinality(m.builder_pubkey) AS winning_builder_pubkey,
+    toLowCardinality(m.relay_name) AS winning_relay
 FROM blocks b
 GLOBAL LEFT JOIN ethseer_validator_entity e
     ON b.proposer_index = e.index
@@ -77,8 +80,14 @@ LEFT JOIN blobs bl
     ON b.slot = bl.slot AND b.block_root = bl.block_root
 LEFT JOIN mev m
     ON b.slot = m.slot
-ORDER BY b.slot DESC
+ORDER BY b.slot ASC
 """
 
-    df = client.query_df(query)
-    return df, query
+    # Send the low-cardinality columns as Arrow dictionaries rather than
+    # repeating every string value per row
+    stream = client.query_arrow_stream(
+        query,
+        parameters={"target_date": target_date, "network": network},
+        settings={"output_format_arrow_low_cardinality_as_dictionary": 1},
+    )
+    return stream, query
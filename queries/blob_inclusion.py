@@ -1,143 +1,141 @@
 """
 Fetch functions for blob inclusion analysis.
 
-Each function executes SQL and returns the DataFrame and query string.
+All four datasets derive from a single per-block query (slot, epoch, blob
+count). It is executed once per date and shared between the fetchers instead
+of each one rescanning canonical_beacon_block and
+canonical_beacon_blob_sidecar. Each function returns the DataFrame and the
+query string. Output DateTime columns are cast to DateTime64 because
+ClickHouse's Arrow format sends plain DateTime as UInt32.
 """
 
+import threading
 from pathlib import Path
 
+import pandas as pd
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+# Shared per-block result keyed by (target_date, network), so the four blob
+# fetchers issue one ClickHouse query per date. This per-process, single-key
+# cache is intentional: fetch_data runs one date at a time, so clearing on a
+# miss bounds memory to a single day's frame. The lock is held across the
+# round trip so fetchers running in parallel for the same date wait for the
+# first query instead of each issuing their own.
+_blocks_cache: dict[tuple[str, str], tuple[pd.DataFrame, str]] = {}
+_blocks_lock = threading.Lock()
 
 
-def fetch_blobs_per_slot(
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
+
+
+def _fetch_blocks_with_blob_counts(
     client,
     target_date: str,
-    network: str = "mainnet",
-) -> tuple:
-    """Fetch blobs per slot data.
+    network: str,
+) -> tuple[pd.DataFrame, str]:
+    """Fetch one row per canonical block with its blob count.
+
+    Cached per (target_date, network); callers must not mutate the DataFrame.
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    key = (target_date, network)
+    with _blocks_lock:
+        if key in _blocks_cache:
+            return _blocks_cache[key]
 
-    query = f"""
-SELECT
-    s.slot AS slot,
-    s.slot_start_date_time AS time,
-    COALESCE(b.blob_count, 0) AS blob_count
-FROM (
-    SELECT DISTINCT slot, slot_start_date_time
-    FROM default.canonical_beacon_block
-    WHERE meta_network_name = '{network}'
+        date_filter = _get_date_filter()
+
+        query = f"""
+WITH blocks AS (
+    SELECT DISTINCT
+        slot,
+        epoch,
+        slot_start_date_time,
+        epoch_start_date_time
+    FROM canonical_beacon_block
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
-) s
-LEFT JOIN (
+),
+blob_counts_per_slot AS (
     SELECT
         slot,
-        COUNT(*) AS blob_count
-    FROM default.canonical_beacon_blob_sidecar
-    WHERE meta_network_name = '{network}'
+        toUInt64(COUNT(*)) as sidecar_count,
+        toUInt64(max(blob_index) + 1) as blob_count
+    FROM canonical_beacon_blob_sidecar
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot
-) b ON s.slot = b.slot
-ORDER BY s.slot ASC
+)
+SELECT
+    b.slot AS slot,
+    b.epoch AS epoch,
+    toDateTime64(b.slot_start_date_time, 0) AS slot_start_date_time,
+    toDateTime64(b.epoch_start_date_time, 0) AS epoch_start_date_time,
+    COALESCE(bc.sidecar_count, toUInt64(0)) as sidecar_count,
+    COALESCE(bc.blob_count, toUInt64(0)) as blob_count
+FROM blocks b
+GLOBAL LEFT JOIN blob_counts_per_slot bc ON b.slot = bc.slot
+ORDER BY b.slot ASC
 """
 
-    df = client.query_df(query)
-    return df, query
+        df = client.query_arrow(
+            query, parameters={"target_date": target_date, "network": network}
+        ).to_pandas()
+        _blocks_cache.clear()
+        _blocks_cache[key] = (df, query)
+        return df, query
 
 
-def fetch_blocks_blob_epoch(
+def fetch_blobs_per_slot(
     client,
     target_date: str,
     network: str = "mainnet",
 ) -> tuple:
-    """Fetch block counts by blob count per epoch.
+    """Fetch blobs per slot data.
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    blocks, query = _fetch_blocks_with_blob_counts(client, target_date, network)
 
-    query = f"""
-WITH blob_counts_per_slot AS (
-    SELECT
-        slot,
-        epoch,
-        epoch_start_date_time,
-        slot_start_date_time,
-        toUInt64(max(blob_index) + 1) as blob_count
-    FROM canonical_beacon_blob_sidecar
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-    GROUP BY slot, epoch, epoch_start_date_time, slot_start_date_time
-),
-blocks_per_epoch AS (
-    SELECT
-        epoch,
-        epoch_start_date_time,
-        toUInt64(COUNT(DISTINCT slot)) as total_blocks
-    FROM canonical_beacon_block
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-    GROUP BY epoch, epoch_start_date_time
-),
-epochs AS (
-    SELECT DISTINCT epoch, epoch_start_date_time
-    FROM blocks_per_epoch
-),
-all_blob_counts AS (
-    SELECT arrayJoin(range(toUInt64(0), toUInt64(max(blob_count) + 1))) AS blob_count
-    FROM blob_counts_per_slot
-),
-all_combinations AS (
-    SELECT
-        e.epoch,
-        e.epoch_start_date_time,
-        b.blob_count
-    FROM epochs e
-    CROSS JOIN all_blob_counts b
-),
-block_per_blob_count_per_epoch AS (
-    SELECT
-        epoch,
-        epoch_start_date_time,
-        blob_count,
-        toUInt64(COUNT(*)) as block_count
-    FROM blob_counts_per_slot
-    GROUP BY epoch, epoch_start_date_time, blob_count
-),
-blocks_with_blobs_per_epoch AS (
-    SELECT
-        epoch,
-        toUInt64(COUNT(*)) as blocks_with_blobs
-    FROM blob_counts_per_slot
-    GROUP BY epoch
-)
-SELECT
-    a.epoch AS epoch,
-    a.epoch_start_date_time AS time,
-    a.blob_count AS blob_count,
-    CASE
-        WHEN a.blob_count = 0 THEN
-            toInt64(COALESCE(blk.total_blocks, toUInt64(0))) - toInt64(COALESCE(wb.blocks_with_blobs, toUInt64(0)))
-        ELSE
-            toInt64(COALESCE(b.block_count, toUInt64(0)))
-    END as block_count
-FROM all_combinations a
-GLOBAL LEFT JOIN block_per_blob_count_per_epoch b
-    ON a.epoch = b.epoch AND a.blob_count = b.blob_count
-GLOBAL LEFT JOIN blocks_per_epoch blk
-    ON a.epoch = blk.epoch
-GLOBAL LEFT JOIN blocks_with_blobs_per_epoch wb
-    ON a.epoch = wb.epoch
-ORDER BY a.epoch ASC, a.blob_count ASC
-"""
+    df = blocks[["slot", "slot_start_date_time", "sidecar_count"]].rename(
+        columns={"slot_start_date_time": "time", "sidecar_count": "blob_count"}
+    )
+    return df.reset_index(drop=True), query
 
-    df = client.query_df(query)
-    return df, query
+
+def fetch_blocks_blob_epoch(
+    client,
+    target_date: str,
+    network: str = "mainnet",
+) -> tuple:
+    """Fetch block counts by blob count per epoch.
+
+    Every (epoch, blob_count) pair from 0 to the day's max blob count is
+    present, with block_count 0 where no block had that many blobs.
+
+    Returns (df, query).
+    """
+    blocks, query = _fetch_blocks_with_blob_counts(client, target_date, network)
+
+    max_blob_count = int(blocks["blob_count"].max()) if not blocks.empty else 0
+    epoch_times = blocks.groupby("epoch")["epoch_start_date_time"].first()
+
+    # Unroll 0..max_blob_count per epoch by reindexing the counts, instead of
+    # materializing an epochs x blob_counts cross join and merging into it
+    full_index = pd.MultiIndex.from_product(
+        [epoch_times.index, range(max_blob_count + 1)], names=["epoch", "blob_count"]
+    )
+    df = (
+        blocks.groupby(["epoch", blocks["blob_count"].astype("int64")])
+        .size()
+        .reindex(full_index, fill_value=0)
+        .astype("int64")
+        .reset_index(name="block_count")
+    )
+    df.insert(1, "time", epoch_times.reindex(df["epoch"]).to_numpy())
+    return df[["epoch", "time", "blob_count", "block_count"]], query
 
 
 def fetch_blob_popularity(
@@ -149,47 +147,16 @@ def fetch_blob_popularity(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
-
-    query = f"""
-WITH blob_counts_per_slot AS (
-    SELECT
-        slot_start_date_time,
-        epoch_start_date_time,
-        toUInt64(max(blob_index) + 1) as blob_count
-    FROM canonical_beacon_blob_sidecar
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-    GROUP BY slot, slot_start_date_time, epoch_start_date_time
-),
-blocks AS (
-    SELECT DISTINCT
-        epoch,
-        slot_start_date_time,
-        epoch_start_date_time
-    FROM canonical_beacon_block
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-),
-blocks_with_blob_count AS (
-    SELECT
-        b.epoch,
-        b.epoch_start_date_time as time,
-        COALESCE(bc.blob_count, toUInt64(0)) as blob_count
-    FROM blocks b
-    GLOBAL LEFT JOIN blob_counts_per_slot bc ON b.slot_start_date_time = bc.slot_start_date_time
-)
-SELECT
-    epoch,
-    time,
-    blob_count,
-    COUNT(*) as count
-FROM blocks_with_blob_count
-GROUP BY epoch, time, blob_count
-ORDER BY epoch ASC, blob_count ASC
-"""
-
-    df = client.query_df(query)
+    blocks, query = _fetch_blocks_with_blob_counts(client, target_date, network)
+
+    df = (
+        blocks.groupby(["epoch", "epoch_start_date_time", "blob_count"])
+        .size()
+        .reset_index(name="count")
+        .rename(columns={"epoch_start_date_time": "time"})
+        .sort_values(["epoch", "blob_count"])
+        .reset_index(drop=True)
+    )
     return df, query
 
 
@@ -202,49 +169,18 @@ def fetch_slot_in_epoch(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
-
-    query = f"""
-WITH blob_counts_per_slot AS (
-    SELECT
-        slot,
-        epoch,
-        epoch_start_date_time,
-        toUInt64(max(blob_index) + 1) as blob_count
-    FROM canonical_beacon_blob_sidecar
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-    GROUP BY slot, epoch, epoch_start_date_time
-),
-blocks AS (
-    SELECT DISTINCT
-        slot,
-        epoch,
-        epoch_start_date_time
-    FROM canonical_beacon_block
-    WHERE meta_network_name = '{network}'
-      AND {date_filter}
-),
-blocks_with_blob_count AS (
-    SELECT
-        b.slot,
-        b.epoch,
-        b.epoch_start_date_time,
-        b.slot - (b.epoch * 32) as slot_in_epoch,
-        COALESCE(bc.blob_count, toUInt64(0)) as blob_count
-    FROM blocks b
-    GLOBAL LEFT JOIN blob_counts_per_slot bc
-        ON b.slot = bc.slot AND b.epoch = bc.epoch
-)
-SELECT
-    slot,
-    epoch,
-    epoch_start_date_time as time,
-    slot_in_epoch,
-    blob_count
-FROM blocks_with_blob_count
-ORDER BY epoch ASC, slot_in_epoch ASC
-"""
-
-    df = client.query_df(query)
-    return df, query
+    blocks, query = _fetch_blocks_with_blob_counts(client, target_date, network)
+
+    # Derived client-side rather than shipped as an extra column
+    slot_in_epoch = (
+        blocks["slot"].to_numpy(dtype="int64")
+        - blocks["epoch"].to_numpy(dtype="int64") * 32
+    )
+    df = (
+        blocks[["slot", "epoch", "epoch_start_date_time", "blob_count"]]
+        .assign(slot_in_epoch=slot_in_epoch)
+        .rename(columns={"epoch_start_date_time": "time"})
+        .sort_values(["epoch", "slot_in_epoch"])
+        .reset_index(drop=True)
+    )
+    return df[["slot", "epoch", "time", "slot_in_epoch", "blob_count"]], query
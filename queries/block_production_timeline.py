@@ -5,9 +5,9 @@ Each function executes SQL and returns the DataFrame and query string.
 """
 
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_block_production_timeline(
@@ -24,8 +24,8 @@ def fetch_block_production_timeline(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
-    event_date_filter = _get_date_filter(target_date, "event_date_time")
+    date_filter = _get_date_filter()
+    event_date_filter = _get_date_filter("event_date_time")
 
     query = f"""
 WITH
@@ -36,7 +36,7 @@ slots AS (
         slot_start_date_time,
         proposer_validator_index
     FROM canonical_beacon_proposer_duty
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -46,7 +46,7 @@ proposer_entity AS (
         index,
         entity
     FROM ethseer_validator_entity
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
 ),
 
 -- Blob count per slot
@@ -55,7 +55,7 @@ blob_count AS (
         slot,
         uniq(blob_index) AS blob_count
     FROM canonical_beacon_blob_sidecar
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot
 ),
@@ -66,7 +66,7 @@ canonical_block AS (
         slot,
         execution_payload_block_hash
     FROM canonical_beacon_block
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -78,7 +78,7 @@ mev_bids AS (
         min(timestamp_ms) AS first_bid_timestamp_ms,
         max(timestamp_ms) AS last_bid_timestamp_ms
     FROM mev_relay_bid_trace
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot, slot_start_date_time
 ),
@@ -97,7 +97,7 @@ mev_payload AS (
     FROM canonical_block cb
     GLOBAL INNER JOIN mev_relay_proposer_payload_delivered pd
         ON cb.slot = pd.slot AND cb.execution_payload_block_hash = pd.block_hash
-    WHERE pd.meta_network_name = '{network}'
+    WHERE pd.meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY cb.slot, cb.execution_payload_block_hash
 ),
@@ -110,7 +110,7 @@ winning_bid AS (
         argMin(bt.timestamp_ms, bt.event_date_time) AS winning_bid_timestamp_ms
     FROM mev_relay_bid_trace bt
     GLOBAL INNER JOIN mev_payload mp ON bt.slot = mp.slot AND bt.block_hash = mp.winning_block_hash
-    WHERE bt.meta_network_name = '{network}'
+    WHERE bt.meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY bt.slot, bt.slot_start_date_time
 ),
@@ -122,7 +122,7 @@ block_gossip AS (
         min(event_date_time) AS block_first_seen,
         max(event_date_time) AS block_last_seen
     FROM libp2p_gossipsub_beacon_block
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
     GROUP BY slot
 ),
@@ -139,7 +139,7 @@ column_gossip AS (
             column_index,
             min(event_date_time) AS first_seen
         FROM libp2p_gossipsub_data_column_sidecar
-        WHERE meta_network_name = '{network}'
+        WHERE meta_network_name = {{network:String}}
           AND {date_filter}
           AND event_date_time > '1970-01-01 00:00:01'
         GROUP BY slot, column_index
@@ -196,5 +196,7 @@ GLOBAL LEFT JOIN column_gossip cg ON s.slot = cg.slot
 ORDER BY s.slot DESC
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
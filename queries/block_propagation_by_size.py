@@ -9,9 +9,9 @@ Xatu captures both compressed and uncompressed block sizes:
 """
 
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_block_propagation_by_size(
@@ -29,7 +29,7 @@ def fetch_block_propagation_by_size(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 WITH
@@ -37,7 +37,7 @@ WITH
 mev_slots AS (
     SELECT DISTINCT slot
     FROM mev_relay_proposer_payload_delivered FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -50,7 +50,7 @@ block_meta AS (
         block_total_bytes,
         block_total_bytes_compressed
     FROM canonical_beacon_block FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -58,7 +58,7 @@ block_meta AS (
 proposer_entity AS (
     SELECT index, entity
     FROM ethseer_validator_entity FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
 ),
 
 -- Propagation timing aggregated across all sentries
@@ -71,7 +71,7 @@ propagation AS (
         quantile(0.5)(propagation_slot_start_diff) AS median_ms,
         count() AS sentry_count
     FROM libp2p_gossipsub_beacon_block
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
       AND propagation_slot_start_diff < 12000
     GROUP BY slot, block
@@ -96,7 +96,9 @@ WHERE bm.block_total_bytes IS NOT NULL
 ORDER BY p.slot
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
 
 
@@ -111,7 +113,7 @@ def fetch_block_propagation_by_region(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 WITH
@@ -119,7 +121,7 @@ WITH
 mev_slots AS (
     SELECT DISTINCT slot
     FROM mev_relay_proposer_payload_delivered FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -132,7 +134,7 @@ block_meta AS (
         block_total_bytes,
         block_total_bytes_compressed
     FROM canonical_beacon_block FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 
@@ -140,7 +142,7 @@ block_meta AS (
 proposer_entity AS (
     SELECT index, entity
     FROM ethseer_validator_entity FINAL
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
 ),
 
 -- Propagation timing by sentry region
@@ -154,7 +156,7 @@ propagation_by_region AS (
         quantile(0.5)(propagation_slot_start_diff) AS median_ms,
         count() AS sentry_count
     FROM libp2p_gossipsub_beacon_block
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
       AND propagation_slot_start_diff < 12000
       AND meta_client_geo_continent_code IN ('EU', 'NA', 'AS', 'OC')
@@ -180,5 +182,7 @@ WHERE bm.block_total_bytes IS NOT NULL
 ORDER BY pr.slot, pr.region
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
@@ -6,9 +6,9 @@ primarily data centers) - different from Sentries which use libp2p gossipsub.
 """
 
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_block_propagation_by_region_contributoor(
@@ -26,14 +26,14 @@ def fetch_block_propagation_by_region_contributoor(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 WITH
 -- MEV slots (slots with relay payload delivery)
 mev_slots AS (
     SELECT DISTINCT slot
-    FROM {network}.fct_block_mev
+    FROM {{network:Identifier}}.fct_block_mev
     WHERE {date_filter}
 ),
 
@@ -44,7 +44,7 @@ block_meta AS (
         block_root,
         block_total_bytes,
         block_total_bytes_compressed
-    FROM {network}.int_block_canonical
+    FROM {{network:Identifier}}.int_block_canonical
     WHERE {date_filter}
 ),
 
@@ -58,7 +58,7 @@ propagation AS (
         max(seen_slot_start_diff) AS last_seen_ms,
         quantile(0.5)(seen_slot_start_diff) AS median_ms,
         count() AS node_count
-    FROM {network}.fct_block_first_seen_by_node
+    FROM {{network:Identifier}}.fct_block_first_seen_by_node
     WHERE {date_filter}
       AND seen_slot_start_diff < 12000
       AND meta_client_geo_continent_code IN ('EU', 'NA', 'AS', 'OC')
@@ -81,5 +81,7 @@ LEFT JOIN block_meta bm ON p.slot = bm.slot AND p.block_root = bm.block_root
 WHERE bm.block_total_bytes IS NOT NULL
 ORDER BY p.slot, p.region
 """
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
@@ -10,9 +10,9 @@ from pathlib import Path
 NUM_COLUMNS = 128
 
 
-def _get_date_filter(target_date: str, column: str = "event_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "event_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_col_first_seen(
@@ -25,25 +25,35 @@ def fetch_col_first_seen(
 
     Returns (df, query).
     """
-    event_date_filter = _get_date_filter(target_date, "event_date_time")
-    slot_date_filter = _get_date_filter(target_date, "slot_start_date_time")
-
-    col_selects = ",\n    ".join(
-        [f"minIfOrNull(propagation_slot_start_diff, column_index = {i}) AS c{i}" for i in range(num_columns)]
-    )
+    event_date_filter = _get_date_filter("event_date_time")
+    slot_date_filter = _get_date_filter("slot_start_date_time")
 
+    # Aggregate in long format (one min per slot/column) and pivot client-side,
+    # instead of evaluating num_columns conditional aggregates per row
     query = f"""
 SELECT
     slot,
     slot_start_date_time AS time,
-    {col_selects}
+    column_index,
+    min(propagation_slot_start_diff) AS min_diff
 FROM libp2p_gossipsub_data_column_sidecar
 WHERE {event_date_filter}
   AND {slot_date_filter}
-  AND meta_network_name = '{network}'
-GROUP BY slot, slot_start_date_time
-ORDER BY slot
+  AND meta_network_name = {{network:String}}
+GROUP BY slot, slot_start_date_time, column_index
+ORDER BY slot, column_index
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
+
+    # Wide c0..c{n-1} layout; columns never seen for a slot stay NULL
+    df = (
+        df.pivot(index=["slot", "time"], columns="column_index", values="min_diff")
+        .reindex(columns=range(num_columns))
+        .add_prefix("c")
+        .reset_index()
+    )
+    df.columns.name = None
     return df, query
@@ -5,9 +5,9 @@ Analyzes transaction visibility in the public mempool before block inclusion.
 """
 
 
-def _get_date_filter(target_date: str, column: str = "slot_start_date_time") -> str:
-    """Generate SQL date filter for a specific date."""
-    return f"{column} >= '{target_date}' AND {column} < '{target_date}'::date + INTERVAL 1 DAY"
+def _get_date_filter(column: str = "slot_start_date_time") -> str:
+    """Generate SQL date filter bound to the {target_date:Date} query parameter."""
+    return f"{column} >= {{target_date:Date}} AND {column} < {{target_date:Date}} + INTERVAL 1 DAY"
 
 
 def fetch_tx_per_slot(
@@ -21,7 +21,7 @@ def fetch_tx_per_slot(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 SELECT
@@ -30,13 +30,15 @@ SELECT
     type AS tx_type,
     count() AS total_txs
 FROM canonical_beacon_block_execution_transaction
-WHERE meta_network_name = '{network}'
+WHERE meta_network_name = {{network:String}}
   AND {date_filter}
 GROUP BY slot, slot_start_date_time, type
 ORDER BY slot, type
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
 
 
@@ -52,7 +54,7 @@ def fetch_mempool_coverage(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 SELECT
@@ -62,18 +64,20 @@ SELECT
     countIf(hash GLOBAL IN (
         SELECT DISTINCT hash
         FROM mempool_transaction
-        WHERE meta_network_name = '{network}'
-          AND event_date_time >= '{target_date}'::date - INTERVAL 1 HOUR
-          AND event_date_time < '{target_date}'::date + INTERVAL 1 DAY
+        WHERE meta_network_name = {{network:String}}
+          AND event_date_time >= {{target_date:Date}} - INTERVAL 1 HOUR
+          AND event_date_time < {{target_date:Date}} + INTERVAL 1 DAY
     )) AS seen_in_mempool
 FROM canonical_beacon_block_execution_transaction
-WHERE meta_network_name = '{network}'
+WHERE meta_network_name = {{network:String}}
   AND {date_filter}
 GROUP BY hour, tx_type
 ORDER BY hour, tx_type
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
 
 
@@ -86,13 +90,13 @@ def fetch_sentry_coverage(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     query = f"""
 WITH canonical_hashes AS (
     SELECT DISTINCT hash
     FROM canonical_beacon_block_execution_transaction
-    WHERE meta_network_name = '{network}'
+    WHERE meta_network_name = {{network:String}}
       AND {date_filter}
 ),
 total_canonical AS (
@@ -103,15 +107,17 @@ SELECT
     count(DISTINCT hash) AS txs_seen,
     round(count(DISTINCT hash) * 100.0 / (SELECT total FROM total_canonical), 2) AS coverage_pct
 FROM mempool_transaction
-WHERE meta_network_name = '{network}'
-  AND event_date_time >= '{target_date}'::date - INTERVAL 1 HOUR
-  AND event_date_time < '{target_date}'::date + INTERVAL 1 DAY
+WHERE meta_network_name = {{network:String}}
+  AND event_date_time >= {{target_date:Date}} - INTERVAL 1 HOUR
+  AND event_date_time < {{target_date:Date}} + INTERVAL 1 DAY
   AND hash GLOBAL IN (SELECT hash FROM canonical_hashes)
 GROUP BY meta_client_name
 ORDER BY txs_seen DESC
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
 
 
@@ -137,7 +143,7 @@ def fetch_mempool_availability(
 
     Returns (df, query).
     """
-    date_filter = _get_date_filter(target_date)
+    date_filter = _get_date_filter()
 
     # Define reusable condition fragments
     seen_before = """
@@ -183,9 +189,9 @@ WITH first_seen AS (
         hash,
         min(event_date_time) AS first_event_time
     FROM mempool_transaction
-    WHERE meta_network_name = '{network}'
-      AND event_date_time >= '{target_date}'::date - INTERVAL 1 DAY
-      AND event_date_time < '{target_date}'::date + INTERVAL 2 DAY
+    WHERE meta_network_name = {{network:String}}
+      AND event_date_time >= {{target_date:Date}} - INTERVAL 1 DAY
+      AND event_date_time < {{target_date:Date}} + INTERVAL 2 DAY
     GROUP BY hash
 )
 SELECT
@@ -211,13 +217,15 @@ SELECT
     {delay_hist}
 FROM canonical_beacon_block_execution_transaction c
 GLOBAL LEFT JOIN first_seen m ON c.hash = m.hash
-WHERE c.meta_network_name = '{network}'
+WHERE c.meta_network_name = {{network:String}}
   AND {date_filter}
 GROUP BY c.slot, c.slot_start_date_time, c.type
 ORDER BY c.slot, c.type
 """
 
-    df = client.query_df(query)
+    df = client.query_df(
+        query, parameters={"target_date": target_date, "network": network}
+    )
     return df, query
 
 
@@ -9,6 +9,8 @@ Usage:
     python fetch_data.py [--date YYYY-MM-DD] [--output-dir PATH] [--max-days N]
     python fetch_data.py --sync        # Fetch missing + re-fetch stale data
     python fetch_data.py --check-only  # Report staleness without fetching
+    python fetch_data.py --date YYYY-MM-DD --only QUERY_ID --force  # Re-fetch one query
+    python fetch_data.py --reindex     # Rebuild manifest dates from the output directory
 """
 
 import argparse
@@ -17,6 +19,7 @@ import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -24,6 +27,7 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 import clickhouse_connect
+from clickhouse_connect.driver.common import StreamContext
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -38,6 +42,10 @@ from scripts.pipeline import (
     print_staleness_report,
 )
 
+# Small row groups keep per-group min/max statistics selective, so notebook
+# filters on slot/epoch/time can skip most of a file
+ROW_GROUP_SIZE = 8192
+
 
 def get_client(database: str | None = None):
     """Create a ClickHouse client for the specified database.
@@ -67,6 +75,11 @@ def get_client(database: str | None = None):
         password=password,
         secure=True,
         autogenerate_session_id=False,
+        # Compress result payloads on the wire; string-heavy results shrink several-fold
+        compress="lz4",
+        # Queries are parameterized on date/network, so re-runs of the same
+        # query text for a past date can be served from the server query cache
+        settings={"use_query_cache": 1},
     )
 
 
@@ -76,6 +89,106 @@ def get_fetcher(query_config: dict):
     return getattr(module, query_config["function"])
 
 
+def write_parquet(
+    result,
+    output_path: Path,
+    metadata: dict[bytes, bytes],
+    sort_by: str | list[str] | None = None,
+) -> int:
+    """
+    Write a fetcher result to Parquet and return the number of rows written.
+
+    Accepts a clickhouse-connect Arrow stream, a pyarrow Table, or a pandas
+    DataFrame. Streams are written batch by batch so peak memory is bounded
+    by the ClickHouse block size rather than the full result; they are
+    written in query order, so sort_by only applies to Tables and DataFrames.
+
+    An uncompressed Arrow IPC copy is written next to the Parquet file
+    (same name, .arrow suffix) so notebooks can memory-map it without
+    decoding. Parquet stays the canonical format.
+    """
+    arrow_path = output_path.with_suffix(".arrow")
+
+    # Both copies are written to temp files and only moved into place once
+    # complete, so a fetch that fails partway (e.g. a ClickHouse error mid
+    # stream) leaves the previous files intact and the two copies in sync
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    arrow_tmp_path = arrow_path.with_suffix(".arrow.tmp")
+    try:
+        num_rows = _write_outputs(result, tmp_path, arrow_tmp_path, metadata, sort_by)
+        os.replace(tmp_path, output_path)
+        os.replace(arrow_tmp_path, arrow_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        arrow_tmp_path.unlink(missing_ok=True)
+        raise
+    return num_rows
+
+
+def _write_outputs(
+    result,
+    output_path: Path,
+    arrow_path: Path,
+    metadata: dict[bytes, bytes],
+    sort_by: str | list[str] | None,
+) -> int:
+    """Write the Parquet and Arrow IPC copies for write_parquet."""
+    if isinstance(result, StreamContext):
+        num_rows = 0
+        with result as stream:
+            wire_schema = stream.gen.schema
+            # Decode dictionary (LowCardinality) columns to plain values; Parquet
+            # dictionary-encodes them on disk anyway, and notebooks expect object
+            # columns rather than categoricals
+            schema = pa.schema(
+                [
+                    field.with_type(field.type.value_type)
+                    if pa.types.is_dictionary(field.type)
+                    else field
+                    for field in wire_schema
+                ],
+                metadata={**(wire_schema.metadata or {}), **metadata},
+            )
+            with (
+                pq.ParquetWriter(
+                    output_path, schema, compression="zstd", use_dictionary=True
+                ) as writer,
+                pa.OSFile(str(arrow_path), "wb") as sink,
+                pa.ipc.new_file(sink, schema) as arrow_writer,
+            ):
+                for batch in stream:
+                    if schema != wire_schema:
+                        batch = batch.cast(schema)
+                    writer.write_batch(batch, row_group_size=ROW_GROUP_SIZE)
+                    arrow_writer.write_batch(batch)
+                    num_rows += batch.num_rows
+        return num_rows
+
+    if isinstance(result, pa.Table):
+        table = result
+    else:
+        # preserve_index=False matches the previous df.to_parquet(index=False) behavior
+        table = pa.Table.from_pandas(result, preserve_index=False)
+
+    if sort_by:
+        keys = [sort_by] if isinstance(sort_by, str) else sort_by
+        table = table.sort_by([(key, "ascending") for key in keys])
+
+    existing_metadata = table.schema.metadata or {}
+    table = table.replace_schema_metadata({**existing_metadata, **metadata})
+    pq.write_table(
+        table,
+        output_path,
+        compression="zstd",
+        use_dictionary=True,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    with pa.OSFile(str(arrow_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as arrow_writer:
+            arrow_writer.write_table(table)
+    return table.num_rows
+
+
 def fetch_query(
     client,
     query_id: str,
@@ -95,27 +208,62 @@ def fetch_query(
     output_path = date_dir / query_config["output_file"]
 
     fetcher = get_fetcher(query_config)
-    df, query_string = fetcher(client, target_date, network=network)
-
-    # Convert to table and add SQL metadata
-    # preserve_index=False matches the previous df.to_parquet(index=False) behavior
-    table = pa.Table.from_pandas(df, preserve_index=False)
-    existing_metadata = table.schema.metadata or {}
-    new_metadata = {**existing_metadata, b"sql": query_string.encode("utf-8")}
-    table = table.replace_schema_metadata(new_metadata)
-
-    pq.write_table(table, output_path)
+    result, query_string = fetcher(client, target_date, network=network)
+
+    # Fetchers return an Arrow stream, a pyarrow Table, or a pandas DataFrame
+    row_count = write_parquet(
+        result,
+        output_path,
+        {b"sql": query_string.encode("utf-8")},
+        sort_by=query_config.get("sort_by"),
+    )
 
     return {
         "fetched_at": datetime.now(timezone.utc).isoformat(),
         "query_hash": query_hash,
-        "row_count": len(df),
+        "row_count": row_count,
         "file_size_bytes": output_path.stat().st_size if output_path.exists() else 0,
     }
 
 
+def fetch_query_isolated(
+    query_id: str,
+    query_config: dict,
+    target_date: str,
+    output_dir: Path,
+    network: str,
+    query_hash: str,
+) -> dict:
+    """Fetch a single query on its own ClickHouse client.
+
+    clickhouse-connect clients must not run concurrent queries, so each
+    worker thread gets a dedicated connection for the query's database.
+    """
+    client = get_client(query_config.get("database"))
+    try:
+        return fetch_query(
+            client, query_id, query_config, target_date, output_dir, network, query_hash
+        )
+    finally:
+        client.close()
+
+
+def is_cached(entry: dict | None, output_path: Path, query_hash: str) -> bool:
+    """Check whether a manifest entry still describes the parquet on disk.
+
+    The file must exist with the recorded size and have been written by the
+    current version of the query.
+    """
+    if not entry or entry.get("query_hash") != query_hash:
+        return False
+    try:
+        size = output_path.stat().st_size
+    except FileNotFoundError:
+        return False
+    return size > 0 and size == entry.get("file_size_bytes")
+
+
 def fetch_date(
-    default_client,
     config: dict,
     target_date: str,
     output_dir: Path,
@@ -126,14 +274,16 @@ def fetch_date(
     """
     Fetch all queries for a date.
 
+    Queries run concurrently (settings.parallel_workers threads) since they
+    are bound by ClickHouse and network latency, not local CPU.
+
     Returns dict of query_id -> metadata for manifest.
     """
     results = {}
     queries = config["queries"]
+    max_workers = config.get("settings", {}).get("parallel_workers", 4)
 
-    # Cache for clients by database to avoid creating multiple connections
-    client_cache: dict[str | None, object] = {None: default_client}
-
+    to_fetch: dict[str, tuple[dict, str]] = {}
     for query_id, query_config in queries.items():
         if queries_to_fetch and query_id not in queries_to_fetch:
             # We explicitly skip if we have a fetch list and this query isn't in it
@@ -150,18 +300,21 @@ def fetch_date(
         if fetch_reason == "SKIP":
             print(f"  SKIP: {query_id} (unchanged)")
             continue
+        if fetch_reason == "CACHED":
+            print(f"  SKIP: {query_id} [cached]")
+            continue
+
+        to_fetch[query_id] = (query_config, fetch_reason)
 
-        # Get the appropriate client for this query's database
-        database = query_config.get("database")
-        if database not in client_cache:
-            print(f"  Creating client for database: {database}...")
-            client_cache[database] = get_client(database)
-        client = client_cache[database]
-
-        print(f"  Fetching {query_id} ({fetch_reason})...")
-        try:
-            metadata = fetch_query(
-                client,
+    if not to_fetch:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for query_id, (query_config, fetch_reason) in to_fetch.items():
+            print(f"  Fetching {query_id} ({fetch_reason})...")
+            future = executor.submit(
+                fetch_query_isolated,
                 query_id,
                 query_config,
                 target_date,
@@ -169,10 +322,16 @@ def fetch_date(
                 network,
                 query_hashes[query_id],
             )
-            results[query_id] = metadata
-            print(f"    -> {metadata['row_count']} rows")
-        except Exception as e:
-            print(f"    -> ERROR: {e}")
+            futures[future] = query_id
+
+        for future in as_completed(futures):
+            query_id = futures[future]
+            try:
+                metadata = future.result()
+                results[query_id] = metadata
+                print(f"    {query_id} -> {metadata['row_count']} rows")
+            except Exception as e:
+                print(f"    {query_id} -> ERROR: {e}")
 
     return results
 
@@ -183,8 +342,13 @@ def update_manifest(
     date_results: dict[str, dict],
     query_hashes: dict[str, str],
     max_days: int | None = None,
+    reindex: bool = False,
 ) -> None:
-    """Update manifest with fetch results."""
+    """Update manifest with fetch results.
+
+    The date list is maintained incrementally from the existing manifest; the
+    output directory is only scanned when reindex is set or no manifest exists.
+    """
     manifest_path = output_dir / "manifest.json"
 
     # Load existing or create new
@@ -192,6 +356,7 @@ def update_manifest(
         with open(manifest_path) as f:
             manifest = json.load(f)
     else:
+        reindex = True
         manifest = {
             "schema_version": "2.0",
             "dates": [],
@@ -214,11 +379,16 @@ def update_manifest(
             manifest["date_queries"][date] = {}
         manifest["date_queries"][date].update(queries)
 
-    # Find all dates from directories
-    all_dates = set()
-    for d in output_dir.iterdir():
-        if d.is_dir() and len(d.name) == 10 and d.name[0].isdigit():
-            all_dates.add(d.name)
+    if reindex:
+        # Rebuild from the date directories on disk
+        all_dates = set()
+        for d in output_dir.iterdir():
+            if d.is_dir() and len(d.name) == 10 and d.name[0].isdigit():
+                all_dates.add(d.name)
+    else:
+        all_dates = set(manifest["dates"]) | {
+            date for date, queries in date_results.items() if queries
+        }
     dates = sorted(all_dates, reverse=True)
 
     # Prune old dates if max_days specified
@@ -240,8 +410,12 @@ def update_manifest(
     manifest["latest"] = dates[0] if dates else None
     manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
 
-    with open(manifest_path, "w") as f:
+    # Write to a temp file and rename so an interrupted run never leaves a
+    # truncated manifest behind
+    tmp_path = manifest_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
         json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
 
 
 def main() -> None:
@@ -258,12 +432,17 @@ def main() -> None:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force re-fetch all data in range even if not stale",
+        help="Force re-fetch all data in range even if not stale or already cached",
     )
     parser.add_argument(
         "--check-only", action="store_true", help="Only check staleness, don't fetch"
     )
-    parser.add_argument("--query", help="Fetch specific query only")
+    parser.add_argument("--query", "--only", help="Fetch specific query only")
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild the manifest date list from the output directory",
+    )
     args = parser.parse_args()
 
     load_dotenv()
@@ -317,6 +496,20 @@ def main() -> None:
         yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
         fetch_plan = {yesterday: {qid: "daily" for qid in config["queries"]}}
 
+    if not args.force and not args.sync:
+        # Skip query/date combinations whose parquet is already on disk as
+        # recorded in the output manifest, so re-runs don't re-query ClickHouse
+        output_manifest_path = output_dir / "manifest.json"
+        if output_manifest_path.exists():
+            with open(output_manifest_path) as f:
+                date_queries = json.load(f).get("date_queries", {})
+            for date, query_plan in fetch_plan.items():
+                for query_id in query_plan:
+                    output_path = output_dir / date / config["queries"][query_id]["output_file"]
+                    entry = date_queries.get(date, {}).get(query_id)
+                    if is_cached(entry, output_path, query_hashes[query_id]):
+                        query_plan[query_id] = "CACHED"
+
     if args.query:
         # Filter plan to specific query
         new_plan = {}
@@ -329,24 +522,23 @@ def main() -> None:
         print("Nothing to fetch.")
         return
 
-    # Create default ClickHouse client (Sentries)
-    # Queries with database: "contributoor" will get their own client
-    client = get_client()
-
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Fetch data
-    all_results: dict[str, dict] = {}
+    # Fetch data, recording each date in the manifest as soon as it completes
     for date, query_plan in sorted(fetch_plan.items()):
-        print(f"\nFetching {date} ({len([q for q, r in query_plan.items() if r != 'SKIP'])} queries)...")
+        num_queries = len([q for q, r in query_plan.items() if r not in ("SKIP", "CACHED")])
+        print(f"\nFetching {date} ({num_queries} queries)...")
         results = fetch_date(
-            client, config, date, output_dir, args.network, query_hashes, query_plan
+            config, date, output_dir, args.network, query_hashes, query_plan
         )
-        all_results[date] = results
+        if results:
+            update_manifest(config, output_dir, {date: results}, query_hashes)
 
     # Update manifest
     print("\nUpdating manifest...")
-    update_manifest(config, output_dir, all_results, query_hashes, args.max_days)
+    update_manifest(
+        config, output_dir, {}, query_hashes, args.max_days, reindex=args.reindex
+    )
 
     print("\nDone!")
 
@@ -110,6 +110,38 @@ def resolve_dates(config: dict, override_date: str | None = None) -> list[str]:
     raise ValueError(f"Unknown date mode: {mode}")
 
 
+def _normalized_ast(func) -> ast.Module:
+    """Parse a function's source to an AST with docstrings removed."""
+    tree = ast.parse(inspect.getsource(func))
+
+    # Remove docstrings for hash stability (allows docstring changes without invalidating data)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if (
+                node.body
+                and isinstance(node.body[0], ast.Expr)
+                and isinstance(node.body[0].value, ast.Constant)
+                and isinstance(node.body[0].value.value, str)
+            ):
+                node.body = node.body[1:]
+
+    return tree
+
+
+def _called_module_functions(module, tree: ast.Module) -> set[str]:
+    """Names of functions defined in module that are called by name in tree."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            obj = getattr(module, node.func.id, None)
+            if obj is None:
+                continue
+            obj = inspect.unwrap(obj)
+            if inspect.isfunction(obj) and obj.__module__ == module.__name__:
+                names.add(node.func.id)
+    return names
+
+
 def compute_query_hash(module_name: str, function_name: str) -> str:
     """
     Compute a stable hash of a query function's source code.
@@ -119,29 +151,25 @@ def compute_query_hash(module_name: str, function_name: str) -> str:
     2. Get function source using inspect.getsource()
     3. Parse with AST to normalize whitespace/comments
     4. Remove docstrings for hash stability
-    5. Hash the AST dump
+    5. Repeat for every function of the same module it calls (transitively),
+       so SQL in a shared helper is part of each caller's hash
+    6. Hash the AST dumps, the query function first and helpers by name
 
     Returns first 12 characters of SHA256 hash.
     """
     module = importlib.import_module(module_name)
-    func = getattr(module, function_name)
-    source = inspect.getsource(func)
-
-    # Parse to AST to normalize formatting
-    tree = ast.parse(source)
-
-    # Remove docstrings for hash stability (allows docstring changes without invalidating data)
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if (
-                node.body
-                and isinstance(node.body[0], ast.Expr)
-                and isinstance(node.body[0].value, ast.Constant)
-                and isinstance(node.body[0].value.value, str)
-            ):
-                node.body = node.body[1:]
 
-    ast_dump = ast.dump(tree, annotate_fields=True)
+    trees = {function_name: _normalized_ast(inspect.unwrap(getattr(module, function_name)))}
+    pending = _called_module_functions(module, trees[function_name])
+    while pending:
+        name = pending.pop()
+        if name in trees:
+            continue
+        trees[name] = _normalized_ast(inspect.unwrap(getattr(module, name)))
+        pending |= _called_module_functions(module, trees[name])
+
+    names = [function_name] + sorted(name for name in trees if name != function_name)
+    ast_dump = "\n".join(ast.dump(trees[name], annotate_fields=True) for name in names)
     return hashlib.sha256(ast_dump.encode()).hexdigest()[:12]
 
 
@@ -18,17 +18,23 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from prometheus_api_client import PrometheusConnect
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -39,14 +45,30 @@ class DevnetIteration:
     """Represents a single devnet iteration."""
 
     id: str
-    start_time: str  # ISO format
-    end_time: str  # ISO format
+    start_time: datetime  # Serialized as ISO format
+    end_time: datetime  # Serialized as ISO format
     duration_hours: float
     start_slot: int
     end_slot: int
     clients: list[str]  # List of client/job names seen
     notes: str = ""
 
+    @classmethod
+    def from_json(cls, entry: dict) -> "DevnetIteration":
+        """Build from a devnets.json entry, parsing the ISO timestamps."""
+        return cls(**{
+            **entry,
+            "start_time": datetime.fromisoformat(entry["start_time"]),
+            "end_time": datetime.fromisoformat(entry["end_time"]),
+        })
+
+    def to_json(self) -> dict:
+        """Serialize for devnets.json, with ISO format timestamps."""
+        d = asdict(self)
+        d["start_time"] = self.start_time.isoformat()
+        d["end_time"] = self.end_time.isoformat()
+        return d
+
 
 def devnet_id_from_timestamp(dt: datetime) -> str:
     """Derive a deterministic devnet ID from its start timestamp."""
@@ -60,7 +82,7 @@ def load_existing_devnets(path: Path) -> list[DevnetIteration]:
     with open(path) as f:
         data = json.load(f)
     return [
-        DevnetIteration(**entry)
+        DevnetIteration.from_json(entry)
         for entry in data.get("devnets", [])
     ]
 
@@ -82,15 +104,12 @@ def merge_devnets(
     """
     tolerance = timedelta(minutes=tolerance_minutes)
 
-    def parse_time(iso: str) -> datetime:
-        return datetime.fromisoformat(iso)
-
     # Track which existing devnets are already claimed
     matched_existing: set[str] = set()
     merged: list[DevnetIteration] = []
 
     for det in detected:
-        det_start = parse_time(det.start_time)
+        det_start = det.start_time
 
         # Find closest unclaimed existing devnet within tolerance
         best_match: Optional[DevnetIteration] = None
@@ -99,7 +118,7 @@ def merge_devnets(
         for ex in existing:
             if ex.id in matched_existing:
                 continue
-            ex_start = parse_time(ex.start_time)
+            ex_start = ex.start_time
             delta = abs(det_start - ex_start)
             if delta <= tolerance and delta < best_delta:
                 best_match = ex
@@ -109,8 +128,8 @@ def merge_devnets(
             # Keep existing ID and start_time, update everything else
             matched_existing.add(best_match.id)
             # Recalculate duration from the stable start_time and fresh end_time
-            stable_start = parse_time(best_match.start_time)
-            fresh_end = parse_time(det.end_time)
+            stable_start = best_match.start_time
+            fresh_end = det.end_time
             duration = round((fresh_end - stable_start).total_seconds() / 3600, 2)
             merged.append(DevnetIteration(
                 id=best_match.id,
@@ -127,11 +146,11 @@ def merge_devnets(
             merged.append(det)
 
     # Preserve historical devnets not re-detected and not shadows of matched ones
-    merged_starts = [parse_time(d.start_time) for d in merged]
+    merged_starts = [d.start_time for d in merged]
     for ex in existing:
         if ex.id in matched_existing:
             continue
-        ex_start = parse_time(ex.start_time)
+        ex_start = ex.start_time
         # Check if this is a shadow of an already-merged devnet
         is_shadow = any(abs(ex_start - ms) <= tolerance for ms in merged_starts)
         if not is_shadow:
@@ -154,7 +173,127 @@ def get_prometheus_client(url: str | None = None) -> PrometheusConnect:
     prometheus_url = url or os.environ.get("PROMETHEUS_URL")
     if not prometheus_url:
         raise ValueError("PROMETHEUS_URL environment variable is required")
-    return PrometheusConnect(url=prometheus_url, disable_ssl=True)
+    # Allow intermediaries to serve identical (step-aligned) requests from cache
+    client = PrometheusConnect(
+        url=prometheus_url,
+        disable_ssl=True,
+        headers={"Cache-Control": "max-age=60"},
+    )
+    # The client keeps one requests.Session; size its keep-alive pool for the
+    # concurrent chunked queries so connections are reused, not reopened
+    client._session.mount(
+        prometheus_url,
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        ),
+    )
+    return client
+
+
+def snap_to_step(dt: datetime, step_seconds: int = 60) -> datetime:
+    """
+    Floor a timestamp to a multiple of step_seconds.
+
+    Aligned ranges produce identical query URLs for the same logical window,
+    so they can be served from HTTP and on-disk caches.
+    """
+    return datetime.fromtimestamp(
+        int(dt.timestamp()) // step_seconds * step_seconds, tz=timezone.utc
+    )
+
+
+# On-disk cache for range queries over windows that are already in the past
+PROM_CACHE_DIR = Path(os.environ.get("PROM_CACHE_DIR", ".prom_cache"))
+
+
+def cached_query_range(
+    client: PrometheusConnect,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    step: str,
+) -> list[dict]:
+    """
+    Run custom_query_range, caching the result on disk.
+
+    Only windows ending more than an hour ago are cached, since samples for
+    recent windows may still be arriving. Entries are pruned by
+    fetch_data_prometheus.py once unused for a while.
+    """
+    cacheable = end_time < datetime.now(timezone.utc) - timedelta(hours=1)
+    key = hashlib.sha256(
+        f"{client.url}|{query}|{start_time.isoformat()}|{end_time.isoformat()}|{step}".encode()
+    ).hexdigest()
+    cache_path = PROM_CACHE_DIR / f"{key}.json"
+
+    if cacheable and cache_path.exists():
+        os.utime(cache_path)  # Mark as recently used for pruning
+        with open(cache_path) as f:
+            return json.load(f)
+
+    result = client.custom_query_range(
+        query=query, start_time=start_time, end_time=end_time, step=step
+    )
+
+    if cacheable:
+        PROM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, cache_path)
+    return result
+
+
+def _time_chunks(
+    start_time: datetime,
+    end_time: datetime,
+    chunk_hours: int,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Split [start_time, end_time] into consecutive windows of chunk_hours.
+
+    Inner boundaries are aligned to multiples of chunk_hours since the epoch,
+    so runs with different start times share (and can cache) the same chunks.
+    """
+    chunk = timedelta(hours=chunk_hours)
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    chunks = []
+    chunk_start = start_time
+    while chunk_start < end_time:
+        next_boundary = epoch + ((chunk_start - epoch) // chunk + 1) * chunk
+        chunk_end = min(end_time, next_boundary)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return chunks
+
+
+def query_range_chunked(
+    client: PrometheusConnect,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    step: str,
+    chunk_hours: int = 24,
+    max_workers: int = 8,
+) -> list[dict]:
+    """
+    Run a range query as concurrent fixed-size time chunks.
+
+    Bounds the size of each Prometheus response and overlaps request latency
+    for multi-day ranges. Series are returned per chunk, so the same metric
+    may appear several times and samples on chunk boundaries are duplicated.
+    """
+    chunks = _time_chunks(start_time, end_time, chunk_hours)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda chunk: cached_query_range(client, query, chunk[0], chunk[1], step),
+            chunks,
+        )
+        return [series for result in results for series in result]
 
 
 def fetch_head_slot_history(
@@ -164,31 +303,39 @@ def fetch_head_slot_history(
     step: str = "1m",
 ) -> pd.DataFrame:
     """Fetch lean_head_slot history for all clients."""
-    result = client.custom_query_range(
-        query="lean_head_slot",
-        start_time=start_time,
-        end_time=end_time,
-        step=step,
-    )
-
-    rows = []
+    result = query_range_chunked(client, "lean_head_slot", start_time, end_time, step)
+
+    # Convert each series' [timestamp, "value"] pairs as whole arrays
+    jobs: list[str] = []
+    instances: list[str] = []
+    counts: list[int] = []
+    ts_parts: list[np.ndarray] = []
+    slot_parts: list[np.ndarray] = []
     for series in result:
-        metric = series.get("metric", {})
-        job = metric.get("job", "unknown")  # Client name
-        instance = metric.get("instance", "unknown")
         values = series.get("values", [])
-        for ts, val in values:
-            rows.append({
-                "client": job,
-                "instance": instance,
-                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                "slot": int(float(val)),
-            })
-
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.sort_values(["client", "timestamp"])
-    return df
+        if not values:
+            continue
+        metric = series.get("metric", {})
+        jobs.append(metric.get("job", "unknown"))  # Client name
+        instances.append(metric.get("instance", "unknown"))
+        counts.append(len(values))
+        samples = np.array(values, dtype=object)
+        ts_parts.append(samples[:, 0].astype(np.float64))
+        slot_parts.append(samples[:, 1].astype(np.float64))
+
+    if not counts:
+        return pd.DataFrame()
+
+    df = pd.DataFrame({
+        "client": pd.Categorical(np.repeat(np.array(jobs, dtype=object), counts)),
+        "instance": pd.Categorical(np.repeat(np.array(instances, dtype=object), counts)),
+        "timestamp": pd.to_datetime(np.concatenate(ts_parts), unit="s", utc=True),
+        # Slots stay far below 2**31 for any devnet
+        "slot": np.concatenate(slot_parts).astype(np.int32),
+    })
+    # Chunk boundaries are fetched twice
+    df = df.drop_duplicates(["client", "instance", "timestamp"])
+    return df.sort_values(["client", "timestamp"])
 
 
 def detect_slot_resets_per_client(
@@ -201,28 +348,28 @@ def detect_slot_resets_per_client(
     A reset is detected when the slot decreases by more than reset_threshold.
     This handles both full resets (to 0) and partial resets.
     """
-    resets = []
-
-    for client in df["client"].unique():
-        client_df = df[df["client"] == client].sort_values("timestamp")
-
-        prev_slot = None
-        prev_timestamp = None
-        for _, row in client_df.iterrows():
-            if prev_slot is not None:
-                # Detect significant slot decrease (reset)
-                if row["slot"] < prev_slot - reset_threshold:
-                    resets.append({
-                        "client": client,
-                        "timestamp": row["timestamp"],
-                        "new_slot": row["slot"],
-                        "prev_slot": prev_slot,
-                        "prev_timestamp": prev_timestamp,
-                    })
-            prev_slot = row["slot"]
-            prev_timestamp = row["timestamp"]
-
-    return pd.DataFrame(resets)
+    # Scan plain arrays sorted by (client code, timestamp): a reset is a row
+    # whose predecessor belongs to the same client and has a much higher slot
+    codes, _ = pd.factorize(df["client"])
+    ts = df["timestamp"].to_numpy(dtype="datetime64[ns]")
+    order = np.lexsort((ts, codes))
+    codes = codes[order]
+    slots = df["slot"].to_numpy()[order]
+
+    reset_pos = np.flatnonzero(
+        (codes[1:] == codes[:-1]) & (slots[1:] < slots[:-1] - reset_threshold)
+    ) + 1
+    rows = order[reset_pos]
+    prev_rows = order[reset_pos - 1]
+
+    resets = pd.DataFrame({
+        "client": df["client"].array[rows],
+        "timestamp": df["timestamp"].array[rows],
+        "new_slot": slots[reset_pos],
+        "prev_slot": slots[reset_pos - 1],
+        "prev_timestamp": df["timestamp"].array[prev_rows],
+    })
+    return resets
 
 
 def cluster_resets_across_clients(
@@ -239,38 +386,28 @@ def cluster_resets_across_clients(
     if resets_df.empty:
         return []
 
-    resets_df = resets_df.sort_values("timestamp")
-    tolerance = timedelta(minutes=tolerance_minutes)
+    resets_df = resets_df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+    tolerance = pd.Timedelta(minutes=tolerance_minutes)
 
-    clusters = []
-    current_cluster = {
-        "start": resets_df.iloc[0]["timestamp"],
-        "end": resets_df.iloc[0]["timestamp"],
-        "clients": {resets_df.iloc[0]["client"]},
-        "resets": [resets_df.iloc[0].to_dict()],
-    }
+    # Resets are sorted, so a new cluster starts wherever the gap to the
+    # previous reset exceeds the tolerance
+    ts = resets_df["timestamp"].to_numpy(dtype="datetime64[ns]")
+    split_idx = np.flatnonzero(np.diff(ts) > tolerance.to_timedelta64()) + 1
+    reset_clients = resets_df["client"].to_numpy()
 
-    for _, row in resets_df.iloc[1:].iterrows():
-        # Check if this reset is within tolerance of current cluster
-        if row["timestamp"] - current_cluster["end"] <= tolerance:
-            current_cluster["clients"].add(row["client"])
-            current_cluster["resets"].append(row.to_dict())
-            current_cluster["end"] = max(current_cluster["end"], row["timestamp"])
-        else:
-            # Save current cluster if it has enough clients
-            if len(current_cluster["clients"]) >= min_clients:
-                clusters.append(current_cluster)
-            # Start new cluster
-            current_cluster = {
-                "start": row["timestamp"],
-                "end": row["timestamp"],
-                "clients": {row["client"]},
-                "resets": [row.to_dict()],
-            }
-
-    # Don't forget the last cluster
-    if len(current_cluster["clients"]) >= min_clients:
-        clusters.append(current_cluster)
+    clusters = []
+    for group in np.split(np.arange(len(resets_df)), split_idx):
+        # Keep clusters with enough clients
+        clients = set(reset_clients[group])
+        if len(clients) < min_clients:
+            continue
+        group_df = resets_df.iloc[group]
+        clusters.append({
+            "start": group_df["timestamp"].iloc[0],
+            "end": group_df["timestamp"].iloc[-1],
+            "clients": clients,
+            "resets": group_df.to_dict("records"),
+        })
 
     return clusters
 
@@ -294,40 +431,61 @@ def build_devnet_iterations(
 
     # Sort clusters by start time
     clusters = sorted(clusters, key=lambda c: c["start"])
+    if not clusters:
+        return []
 
-    # Helper to get slot stats for a time period
-    def get_period_stats(start: datetime, end: datetime) -> tuple[int, int, list[str]]:
-        period_df = df[(df["timestamp"] >= start) & (df["timestamp"] <= end)]
-        if period_df.empty:
+    # Sort once by time; period k covers [starts[k], starts[k + 1]) where
+    # period 0 is the data before the first cluster and period i + 1 is
+    # cluster i's iteration, so one searchsorted gives every boundary
+    ordered = df.sort_values("timestamp", kind="stable")
+    ts = ordered["timestamp"].to_numpy(dtype="datetime64[ns]")
+    slots = ordered["slot"].to_numpy()
+    clients_arr = ordered["client"].to_numpy()
+
+    starts = np.array(
+        [pd.Timestamp(t).value for t in [data_start] + [c["start"] for c in clusters]],
+        dtype="datetime64[ns]",
+    )
+    bounds = np.searchsorted(ts, starts, side="left")
+    ends = np.append(bounds[1:], len(ts))
+
+    # Per-period min/max slot in one sweep; empty periods are skipped since
+    # reduceat is only defined for non-empty segments
+    nonempty = bounds < ends
+    start_slots = np.zeros(len(starts), dtype=np.int64)
+    end_slots = np.zeros(len(starts), dtype=np.int64)
+    if nonempty.any():
+        start_slots[nonempty] = np.minimum.reduceat(slots, bounds[nonempty])
+        end_slots[nonempty] = np.maximum.reduceat(slots, bounds[nonempty])
+
+    def get_period_stats(k: int) -> tuple[int, int, list[str]]:
+        if not nonempty[k]:
             return 0, 0, []
         return (
-            int(period_df["slot"].min()),
-            int(period_df["slot"].max()),
-            list(period_df["client"].unique()),
+            int(start_slots[k]),
+            int(end_slots[k]),
+            sorted(pd.unique(clients_arr[bounds[k]:ends[k]])),
         )
 
     # If there's data before the first cluster, that's the first iteration
-    if clusters:
-        first_cluster_start = clusters[0]["start"]
-        if data_start < first_cluster_start - timedelta(minutes=5):
-            start_slot, end_slot, clients = get_period_stats(
-                data_start, first_cluster_start - timedelta(seconds=1)
-            )
-            if clients:
-                iterations.append(
-                    DevnetIteration(
-                        id=devnet_id_from_timestamp(data_start),
-                        start_time=data_start.isoformat(),
-                        end_time=(first_cluster_start - timedelta(seconds=1)).isoformat(),
-                        duration_hours=round(
-                            (first_cluster_start - data_start).total_seconds() / 3600, 2
-                        ),
-                        start_slot=start_slot,
-                        end_slot=end_slot,
-                        clients=clients,
-                        notes="Pre-existing devnet (data starts before first detected reset)",
-                    )
+    first_cluster_start = clusters[0]["start"]
+    if data_start < first_cluster_start - timedelta(minutes=5):
+        start_slot, end_slot, clients = get_period_stats(0)
+        if clients:
+            iterations.append(
+                DevnetIteration(
+                    id=devnet_id_from_timestamp(data_start),
+                    start_time=data_start,
+                    end_time=first_cluster_start - timedelta(seconds=1),
+                    duration_hours=round(
+                        (first_cluster_start - data_start).total_seconds() / 3600, 2
+                    ),
+                    start_slot=start_slot,
+                    end_slot=end_slot,
+                    clients=clients,
+                    notes="Pre-existing devnet (data starts before first detected reset)",
                 )
+            )
 
     # Process each cluster as the start of a new iteration
     for i, cluster in enumerate(clusters):
@@ -339,7 +497,7 @@ def build_devnet_iterations(
         else:
             iteration_end = data_end
 
-        start_slot, end_slot, clients = get_period_stats(iteration_start, iteration_end)
+        start_slot, end_slot, clients = get_period_stats(i + 1)
 
         if not clients:
             continue
@@ -347,8 +505,8 @@ def build_devnet_iterations(
         iterations.append(
             DevnetIteration(
                 id=devnet_id_from_timestamp(iteration_start),
-                start_time=iteration_start.isoformat(),
-                end_time=iteration_end.isoformat(),
+                start_time=iteration_start,
+                end_time=iteration_end,
                 duration_hours=round(
                     (iteration_end - iteration_start).total_seconds() / 3600, 2
                 ),
@@ -379,7 +537,9 @@ def detect_devnets(
     4. Build devnet iteration objects
     """
     print(f"Fetching head_slot data from {start_time.date()} to {end_time.date()}...")
-    df = fetch_head_slot_history(client, start_time, end_time)
+    df = fetch_head_slot_history(
+        client, snap_to_step(start_time), snap_to_step(end_time)
+    )
 
     if df.empty:
         print("No data found.")
@@ -393,8 +553,7 @@ def detect_devnets(
     print(f"Found {len(resets_df)} slot resets across all clients")
 
     if not resets_df.empty:
-        for client_name in resets_df["client"].unique():
-            count = len(resets_df[resets_df["client"] == client_name])
+        for client_name, count in resets_df.groupby("client", observed=True).size().items():
             print(f"  - {client_name}: {count} resets")
 
     print(f"Clustering resets across clients (tolerance: {tolerance_minutes}min, min_clients: {min_clients})...")
@@ -407,8 +566,8 @@ def detect_devnets(
         return [
             DevnetIteration(
                 id=devnet_id_from_timestamp(df["timestamp"].min()),
-                start_time=df["timestamp"].min().isoformat(),
-                end_time=df["timestamp"].max().isoformat(),
+                start_time=df["timestamp"].min(),
+                end_time=df["timestamp"].max(),
                 duration_hours=round(
                     (df["timestamp"].max() - df["timestamp"].min()).total_seconds()
                     / 3600,
@@ -427,34 +586,43 @@ def detect_devnets(
     return iterations
 
 
-def fetch_container_clients(
+def fetch_container_samples(
     prom: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> set[str]:
-    """Fetch client names from cAdvisor containers for a specific time period."""
-    result = prom.custom_query_range(
-        query="container_cpu_usage_seconds_total",
-        start_time=start_time,
-        end_time=end_time,
-        step="30m",
+    step: str = "5m",
+) -> dict[str, np.ndarray]:
+    """
+    Fetch sample timestamps (epoch seconds) per cAdvisor container.
+
+    Infrastructure containers are excluded. Full container names (e.g.,
+    "ream_0", "ream_1") are kept as client identifiers, since multiple
+    instances of the same implementation are distinct clients.
+    """
+    # Only container presence is needed: aggregate to one series per container
+    # label set server-side instead of returning every per-CPU/cgroup series
+    result = query_range_chunked(
+        prom,
+        "count by (name, container) (container_cpu_usage_seconds_total)",
+        start_time,
+        end_time,
+        step,
     )
 
-    containers = set()
+    timestamps: dict[str, list[float]] = {}
     for series in result:
         metric = series.get("metric", {})
         container = metric.get("name", metric.get("container", "unknown"))
-        if container and container not in ("", "POD"):
-            containers.add(container)
-
-    # Keep full container names (e.g., "ream_0", "ream_1") as client identifiers.
-    # Multiple instances of the same implementation are distinct clients.
-    clients = set()
-    for c in containers:
-        if c in EXCLUDED_CONTAINERS:
+        if not container or container == "POD" or container in EXCLUDED_CONTAINERS:
             continue
-        clients.add(c)
-    return clients
+        timestamps.setdefault(container, []).extend(
+            ts for ts, _ in series.get("values", [])
+        )
+
+    return {
+        container: np.asarray(ts, dtype=np.float64)
+        for container, ts in timestamps.items()
+    }
 
 
 def deduplicate_clients(clients: list[str]) -> list[str]:
@@ -479,18 +647,65 @@ def deduplicate_clients(clients: list[str]) -> list[str]:
 def augment_clients_from_containers(
     iterations: list[DevnetIteration],
     prom: PrometheusConnect,
+    cache_path: Path | None = None,
 ) -> None:
-    """Add clients discovered via cAdvisor containers to each devnet iteration."""
+    """
+    Add clients discovered via cAdvisor containers to each devnet iteration.
+
+    If cache_path is given, the augmented client lists are persisted there by
+    devnet ID, and iterations that ended more than two hours ago reuse their
+    cached list instead of being queried again.
+    """
+    cached: dict[str, list[str]] = {}
+    if cache_path is not None and cache_path.exists():
+        with open(cache_path) as f:
+            cached = json.load(f)
+
+    settled_before = datetime.now(timezone.utc) - timedelta(hours=2)
+    to_fetch = []
     for iteration in iterations:
-        start = datetime.fromisoformat(iteration.start_time)
-        end = datetime.fromisoformat(iteration.end_time)
-        container_clients = fetch_container_clients(prom, start, end)
-
-        merged = set(iteration.clients) | container_clients
-        deduped = deduplicate_clients(list(merged))
-        if set(deduped) != set(iteration.clients):
-            added = sorted(set(deduped) - set(iteration.clients))
-            removed = sorted(set(iteration.clients) - set(deduped))
+        if iteration.id in cached and iteration.end_time < settled_before:
+            iteration.clients = cached[iteration.id]
+        else:
+            to_fetch.append(iteration)
+
+    if to_fetch:
+        _augment_from_containers(to_fetch, prom)
+
+    if cache_path is not None:
+        cached.update({it.id: it.clients for it in iterations})
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(cached, f, indent=2, sort_keys=True)
+
+
+def _augment_from_containers(
+    iterations: list[DevnetIteration],
+    prom: PrometheusConnect,
+) -> None:
+    """Query cAdvisor containers once for all iterations and merge in their clients."""
+    # One range query over all iterations, bucketed per iteration below
+    windows = [(it.start_time, it.end_time) for it in iterations]
+    container_samples = fetch_container_samples(
+        prom,
+        snap_to_step(min(start for start, _ in windows), 300),
+        snap_to_step(max(end for _, end in windows), 300),
+    )
+
+    for iteration, (start, end) in zip(iterations, windows):
+        lo, hi = start.timestamp(), end.timestamp()
+        container_clients = {
+            container
+            for container, ts in container_samples.items()
+            if ((ts >= lo) & (ts <= hi)).any()
+        }
+
+        existing = frozenset(iteration.clients)
+        deduped = deduplicate_clients(list(existing | container_clients))
+        deduped_set = frozenset(deduped)
+        if deduped_set != existing:
+            added = sorted(deduped_set - existing)
+            removed = sorted(existing - deduped_set)
             changes = []
             if added:
                 changes.append(f"added {added}")
@@ -572,7 +787,10 @@ def main() -> None:
 
     # Augment client list with all containers visible via cAdvisor
     print("Fetching container data to discover all running clients...")
-    augment_clients_from_containers(iterations, client)
+    output_path = Path(args.output)
+    augment_clients_from_containers(
+        iterations, client, cache_path=output_path.with_suffix(".clients.json")
+    )
 
     # Filter out short-lived devnets (likely failed runs)
     min_duration_hours = args.min_duration / 60.0
@@ -588,7 +806,6 @@ def main() -> None:
         return
 
     # Merge with existing devnets to maintain stable IDs
-    output_path = Path(args.output)
     if not args.no_merge:
         existing = load_existing_devnets(output_path)
         if existing:
@@ -609,8 +826,8 @@ def main() -> None:
 
     for devnet in iterations:
         print(f"\n{devnet.id}:")
-        print(f"  Start: {devnet.start_time}")
-        print(f"  End:   {devnet.end_time}")
+        print(f"  Start: {devnet.start_time.isoformat()}")
+        print(f"  End:   {devnet.end_time.isoformat()}")
         print(f"  Duration: {devnet.duration_hours} hours")
         print(f"  Slots: {devnet.start_slot} -> {devnet.end_slot}")
         print(f"  Clients: {', '.join(devnet.clients)}")
@@ -631,7 +848,7 @@ def main() -> None:
             "min_clients": args.min_clients,
             "min_duration_minutes": args.min_duration,
         },
-        "devnets": [asdict(d) for d in iterations],
+        "devnets": [d.to_json() for d in iterations],
     }
 
     with open(output_path, "w") as f:
@@ -16,17 +16,24 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dotenv import load_dotenv
-from prometheus_api_client import PrometheusConnect
+from prometheus_api_client import PrometheusApiClientException, PrometheusConnect
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -37,7 +44,23 @@ def get_prometheus_client(url: str | None = None) -> PrometheusConnect:
     prometheus_url = url or os.environ.get("PROMETHEUS_URL")
     if not prometheus_url:
         raise ValueError("PROMETHEUS_URL environment variable is required")
-    return PrometheusConnect(url=prometheus_url, disable_ssl=True)
+    client = PrometheusConnect(url=prometheus_url, disable_ssl=True)
+    # The client keeps one requests.Session shared by every fetch thread; size
+    # its keep-alive pool to the request cap so connections are reused rather
+    # than reopened, and retry transient gateway errors
+    client._session.mount(
+        prometheus_url,
+        HTTPAdapter(
+            pool_connections=MAX_IN_FLIGHT,
+            pool_maxsize=MAX_IN_FLIGHT,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504)
+            ),
+        ),
+    )
+    # Range responses are large and compress well
+    client._session.headers["Accept-Encoding"] = "gzip"
+    return client
 
 
 def load_devnets_manifest(data_dir: Path) -> dict:
@@ -59,10 +82,248 @@ def get_devnet_time_range(devnet: dict) -> tuple[datetime, datetime]:
     return start, end
 
 
+# Coarsest step any range query uses; chunk lengths are snapped to a multiple
+# of it so every query's samples line up across window edges
+MAX_QUERY_STEP = timedelta(minutes=5)
+
+
+def chunked_range(
+    start: datetime,
+    end: datetime,
+    chunk: timedelta = timedelta(hours=24),
+    step: timedelta = MAX_QUERY_STEP,
+) -> list[tuple[datetime, datetime]]:
+    """Split [start, end] into consecutive windows of at most `chunk`.
+
+    The chunk is rounded down to a multiple of step (at least one step), and
+    windows start at start + n * chunk, so each window samples the same
+    timestamps a single query would. Every window but the last stops a second
+    short of the next one so boundary samples are not fetched twice.
+    """
+    chunk = max(step, chunk // step * step)
+    windows = []
+    t0 = start
+    while t0 + chunk < end:
+        windows.append((t0, t0 + chunk - timedelta(seconds=1)))
+        t0 += chunk
+    windows.append((t0, end))
+    return windows
+
+
+# Cap on concurrent HTTP requests to Prometheus across all threads. Devnets,
+# queries and per-metric requests all fan out, so bound the product here.
+MAX_IN_FLIGHT = 8
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+
+PROM_CACHE_DIR = Path(os.environ.get("PROM_CACHE_DIR", ".prom_cache"))
+# Cache files not read or written for this long are pruned at the end of a run
+PROM_CACHE_RETENTION = timedelta(days=7)
+
+
+def _range_query(
+    client: PrometheusConnect,
+    query: str,
+    start_time: datetime,
+    end_time: datetime,
+    step: str,
+) -> list[dict]:
+    """Run a range query, waiting for a free request slot first.
+
+    Equivalent to client.custom_query_range, but the body is parsed straight
+    from bytes with json.loads rather than through Response.json(), which
+    decodes it to text first. Range responses are the bulk of what we
+    download, so this is the one place their parsing happens.
+
+    Responses for windows ending more than an hour ago are cached on disk in
+    PROM_CACHE_DIR, since a finished devnet's samples no longer change; recent
+    windows may still be receiving samples. detect_devnets.py keeps its own
+    entries in the same directory under different keys.
+    """
+    params = {
+        "query": query,
+        "start": round(start_time.timestamp()),
+        "end": round(end_time.timestamp()),
+        "step": step,
+    }
+    cacheable = end_time < datetime.now(timezone.utc) - timedelta(hours=1)
+    key = hashlib.sha256(
+        f"{client.url}/api/v1/query_range|{query}|{params['start']}|{params['end']}|{step}".encode()
+    ).hexdigest()
+    cache_path = PROM_CACHE_DIR / f"{key}.json"
+
+    if cacheable and cache_path.exists():
+        os.utime(cache_path)  # Mark as recently used for prune_prom_cache
+        return json.loads(cache_path.read_bytes())["data"]["result"]
+
+    with _in_flight:
+        response = client._session.get(
+            f"{client.url}/api/v1/query_range",
+            params=params,
+            headers=client.headers,
+            auth=client.auth,
+            timeout=client._timeout,
+        )
+    if response.status_code != 200:
+        raise PrometheusApiClientException(
+            f"HTTP Status Code {response.status_code} ({response.content!r})"
+        )
+    result = json.loads(response.content)["data"]["result"]
+
+    if cacheable:
+        PROM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, cache_path)
+    return result
+
+
+def prune_prom_cache(max_age: timedelta = PROM_CACHE_RETENTION) -> int:
+    """Delete PROM_CACHE_DIR files not used within max_age.
+
+    Covers the entries of both this script and detect_devnets.py, plus temp
+    files left behind by interrupted writes. Returns the number deleted.
+    """
+    if not PROM_CACHE_DIR.is_dir():
+        return 0
+    cutoff = (datetime.now(timezone.utc) - max_age).timestamp()
+    pruned = 0
+    with os.scandir(PROM_CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                pruned += 1
+    return pruned
+
+
+def _range_query_many(
+    client: PrometheusConnect,
+    queries: list[str],
+    start_time: datetime,
+    end_time: datetime,
+    step: str | list[str],
+    ignore_errors: bool = True,
+) -> list[list[dict]]:
+    """Run independent range queries concurrently, in query order.
+
+    step is shared by all queries or given per query. With ignore_errors, a
+    failed query yields an empty result instead of raising (e.g. a metric that
+    no client exposes).
+    """
+    steps = [step] * len(queries) if isinstance(step, str) else step
+
+    def run(query: str, step: str) -> list[dict]:
+        try:
+            return _range_query(client, query, start_time, end_time, step)
+        except Exception:
+            if not ignore_errors:
+                raise
+            return []
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        return list(pool.map(run, queries, steps))
+
+
+def _series_table(
+    parts: list[tuple[dict, list]],
+    drop_nan: bool = False,
+) -> pa.Table:
+    """Build a long-format table from (labels, values) pairs, one per series.
+
+    values is a series' raw [[ts, "value"], ...] list from a range query. It is
+    converted to float64 as a single array and the series' labels are repeated
+    for each of its points, giving the label columns plus timestamp and value.
+    String labels are dictionary-encoded with one code per series.
+    """
+    parts = [(labels, values) for labels, values in parts if values]
+    if not parts:
+        return pa.table({})
+
+    counts = [len(values) for _, values in parts]
+    samples = np.concatenate(
+        [np.asarray(values, dtype=np.float64) for _, values in parts]
+    )
+    columns = {}
+    for col in parts[0][0]:
+        series_labels = [labels[col] for labels, _ in parts]
+        if isinstance(series_labels[0], str):
+            dictionary = list(dict.fromkeys(series_labels))
+            index = {label: i for i, label in enumerate(dictionary)}
+            codes = np.repeat(
+                np.array([index[label] for label in series_labels], dtype=np.int32),
+                counts,
+            )
+            columns[col] = pa.DictionaryArray.from_arrays(codes, pa.array(dictionary))
+        else:
+            columns[col] = pa.array(np.repeat(np.asarray(series_labels), counts))
+    columns["timestamp"] = pa.array(
+        np.round(samples[:, 0] * 1e6).astype(np.int64),
+        type=pa.timestamp("us", tz="UTC"),
+    )
+    columns["value"] = pa.array(samples[:, 1])
+    table = pa.table(columns)
+    if drop_nan:
+        table = table.filter(pa.array(~np.isnan(samples[:, 1])))
+    return table
+
+
+@lru_cache(maxsize=None)
+def _all_metrics(client: PrometheusConnect) -> tuple[str, ...]:
+    """Every metric name in Prometheus, fetched once per client."""
+    with _in_flight:
+        return tuple(client.all_metrics())
+
+
+@lru_cache(maxsize=None)
+def _lean_metrics(client: PrometheusConnect) -> tuple[str, ...]:
+    """Every lean_* metric name, filtered by Prometheus and fetched once per client."""
+    with _in_flight:
+        response = client._session.get(
+            f"{client.url}/api/v1/label/__name__/values",
+            params={"match[]": '{__name__=~"lean_.*"}'},
+            headers=client.headers,
+            auth=client.auth,
+            timeout=client._timeout,
+        )
+    if response.status_code != 200:
+        raise PrometheusApiClientException(
+            f"HTTP Status Code {response.status_code} ({response.content!r})"
+        )
+    return tuple(json.loads(response.content)["data"])
+
+
+def _name_selector(metrics: list[str]) -> str:
+    """Build a single PromQL selector matching any of the given metric names."""
+    return '{__name__=~"' + "|".join(metrics) + '"}'
+
+
+def _histogram_quantile_query(
+    quantiles: list[float],
+    histogram_metrics: list[tuple[str, str]],
+) -> str:
+    """Build one expression for every quantile of several histograms.
+
+    rate() drops __name__, so each histogram_quantile result is tagged with
+    metric and quantile labels instead and the terms are joined with `or`.
+    Where two histograms map to the same name (old and new metric prefixes),
+    `or` keeps the first one's series for a given label set.
+    """
+    return " or ".join(
+        "label_replace(label_replace("
+        f"histogram_quantile({q}, rate({metric_base}_bucket[5m])), "
+        f'"metric", "{metric_name}", "", ""), "quantile", "{q}", "", "")'
+        for metric_base, metric_name in histogram_metrics
+        for q in quantiles
+    )
+
+
 # ============================================
 # Query Functions
 # ============================================
-# Each function fetches a specific metric and returns (df, promql_string)
+# Each function fetches a specific metric and returns (table, promql_string)
 # This mirrors the pattern used in queries/*.py for ClickHouse
 
 
@@ -70,47 +331,59 @@ def fetch_lean_metrics_overview(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch overview of all lean_* metrics for the devnet period.
 
     Returns a sample of each metric to verify data availability.
     """
     # Get all metric names starting with lean_
-    all_metrics = client.all_metrics()
-    lean_metrics = [m for m in all_metrics if m.startswith("lean_")]
+    lean_metrics = _lean_metrics(client)
 
     if not lean_metrics:
-        return pd.DataFrame(), "# No lean_* metrics found"
+        return pa.table({}), "# No lean_* metrics found"
 
-    # Fetch a sample from each metric at the end of the devnet
-    rows = []
-    for metric_name in lean_metrics:
-        try:
-            result = client.custom_query(query=metric_name, params={"time": end_time.timestamp()})
-            rows.append({
+    # Count series per lean_* metric at the end of the devnet server-side, so
+    # only one sample per metric name comes back. Metrics without series at
+    # that time are absent from the result and keep a count of 0.
+    try:
+        with _in_flight:
+            result = client.custom_query(
+                query='count by (__name__) ({__name__=~"lean_.*"})',
+                params={"time": end_time.timestamp()},
+            )
+        series_counts = {
+            series["metric"]["__name__"]: int(series["value"][1]) for series in result
+        }
+        rows = [
+            {
                 "metric_name": metric_name,
-                "series_count": len(result),
-                "has_data": len(result) > 0,
-            })
-        except Exception as e:
-            rows.append({
+                "series_count": series_counts.get(metric_name, 0),
+                "has_data": metric_name in series_counts,
+            }
+            for metric_name in lean_metrics
+        ]
+    except Exception as e:
+        rows = [
+            {
                 "metric_name": metric_name,
                 "series_count": 0,
                 "has_data": False,
                 "error": str(e),
-            })
+            }
+            for metric_name in lean_metrics
+        ]
 
-    df = pd.DataFrame(rows)
-    promql = "# Overview query: checked all lean_* metrics"
-    return df, promql
+    table = pa.Table.from_pylist(rows)
+    promql = 'count by (__name__) ({__name__=~"lean_.*"})'
+    return table, promql
 
 
 def fetch_head_slot(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch chain head tracking metrics.
 
@@ -120,40 +393,32 @@ def fetch_head_slot(
     """
     metrics = ["lean_head_slot", "lean_current_slot"]
 
-    all_rows = []
-    for metric in metrics:
-        try:
-            result = client.custom_query_range(
-                query=metric,
-                start_time=start_time,
-                end_time=end_time,
-                step="1m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                values = series.get("values", [])
-                for ts, val in values:
-                    row = {
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "metric": metric,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": float(val),
-                    }
-                    all_rows.append(row)
-        except Exception:
-            pass
+    promql = _name_selector(metrics)
+
+    parts = []
+    try:
+        result = _range_query(client, promql, start_time, end_time, "1m")
+    except Exception:
+        result = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        metric = metric_labels.get("__name__", "unknown")
+        values = series.get("values", [])
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric,
+        }, values))
 
-    df = pd.DataFrame(all_rows)
-    promql = ", ".join(metrics)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_fork_choice_reorgs(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch fork choice reorg data.
 
@@ -161,35 +426,26 @@ def fetch_fork_choice_reorgs(
     - lean_fork_choice_reorgs_total: Total number of reorgs
     """
     promql = "lean_fork_choice_reorgs_total"
-    result = client.custom_query_range(
-        query=promql,
-        start_time=start_time,
-        end_time=end_time,
-        step="1m",
-    )
+    result = _range_query(client, promql, start_time, end_time, "1m")
 
-    rows = []
+    parts = []
     for series in result:
         metric = series.get("metric", {})
         values = series.get("values", [])
-        for ts, val in values:
-            row = {
-                "client": metric.get("job", "unknown"),
-                "instance": metric.get("instance", "unknown"),
-                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                "value": float(val),
-            }
-            rows.append(row)
+        parts.append(({
+            "client": metric.get("job", "unknown"),
+            "instance": metric.get("instance", "unknown"),
+        }, values))
 
-    df = pd.DataFrame(rows)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_finality_metrics(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch finality-related metrics.
 
@@ -205,40 +461,32 @@ def fetch_finality_metrics(
         "lean_justified_slot",
     ]
 
-    all_rows = []
-    for metric in metrics:
-        try:
-            result = client.custom_query_range(
-                query=metric,
-                start_time=start_time,
-                end_time=end_time,
-                step="1m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                values = series.get("values", [])
-                for ts, val in values:
-                    row = {
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "metric": metric,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": float(val),
-                    }
-                    all_rows.append(row)
-        except Exception:
-            pass
+    promql = _name_selector(metrics)
 
-    df = pd.DataFrame(all_rows)
-    promql = ", ".join(metrics)
-    return df, promql
+    parts = []
+    try:
+        result = _range_query(client, promql, start_time, end_time, "1m")
+    except Exception:
+        result = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        metric = metric_labels.get("__name__", "unknown")
+        values = series.get("values", [])
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric,
+        }, values))
+
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_attestation_metrics(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch attestation validation metrics.
 
@@ -251,41 +499,33 @@ def fetch_attestation_metrics(
         "lean_attestations_invalid_total",
     ]
 
-    all_rows = []
-    for metric in metrics:
-        try:
-            result = client.custom_query_range(
-                query=metric,
-                start_time=start_time,
-                end_time=end_time,
-                step="1m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                values = series.get("values", [])
-                for ts, val in values:
-                    row = {
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "metric": metric,
-                        "source": metric_labels.get("source", "unknown"),
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": float(val),
-                    }
-                    all_rows.append(row)
-        except Exception:
-            pass
+    promql = _name_selector(metrics)
+
+    parts = []
+    try:
+        result = _range_query(client, promql, start_time, end_time, "1m")
+    except Exception:
+        result = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        metric = metric_labels.get("__name__", "unknown")
+        values = series.get("values", [])
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric,
+            "source": metric_labels.get("source", "unknown"),
+        }, values))
 
-    df = pd.DataFrame(all_rows)
-    promql = ", ".join(metrics)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_pq_signature_metrics(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch post-quantum signature metrics.
 
@@ -301,40 +541,32 @@ def fetch_pq_signature_metrics(
         "lean_pq_sig_attestations_in_aggregated_signatures_total",
     ]
 
-    all_rows = []
-    for metric in metrics:
-        try:
-            result = client.custom_query_range(
-                query=metric,
-                start_time=start_time,
-                end_time=end_time,
-                step="1m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                values = series.get("values", [])
-                for ts, val in values:
-                    row = {
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "metric": metric,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": float(val),
-                    }
-                    all_rows.append(row)
-        except Exception:
-            pass
+    promql = _name_selector(metrics)
 
-    df = pd.DataFrame(all_rows)
-    promql = ", ".join(metrics)
-    return df, promql
+    parts = []
+    try:
+        result = _range_query(client, promql, start_time, end_time, "1m")
+    except Exception:
+        result = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        metric = metric_labels.get("__name__", "unknown")
+        values = series.get("values", [])
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric,
+        }, values))
+
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_pq_signature_timing(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch post-quantum signature timing histograms as percentiles.
 
@@ -352,47 +584,43 @@ def fetch_pq_signature_timing(
     ]
     quantiles = [0.5, 0.95, 0.99]
 
-    all_rows = []
-    for metric_base, metric_name in histogram_metrics:
-        for q in quantiles:
-            promql = f'histogram_quantile({q}, rate({metric_base}_bucket[5m]))'
-            try:
-                result = client.custom_query_range(
-                    query=promql,
-                    start_time=start_time,
-                    end_time=end_time,
-                    step="5m",
-                )
-                for series in result:
-                    metric_labels = series.get("metric", {})
-                    values = series.get("values", [])
-                    for ts, val in values:
-                        row = {
-                            "client": metric_labels.get("job", "unknown"),
-                            "instance": metric_labels.get("instance", "unknown"),
-                            "metric": metric_name,
-                            "quantile": q,
-                            "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                            "value": float(val),
-                        }
-                        all_rows.append(row)
-            except Exception:
-                pass
-
-    df = pd.DataFrame(all_rows)
+    # All quantiles of all histograms in one request, told apart by the
+    # metric and quantile labels
+    query = _histogram_quantile_query(quantiles, histogram_metrics)
+    try:
+        result = _range_query(client, query, start_time, end_time, "5m")
+    except Exception:
+        result = []
+
+    parts = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric_labels.get("metric", "unknown"),
+            "quantile": float(metric_labels.get("quantile", "nan")),
+        }, series.get("values", [])))
+
+    table = _series_table(parts)
     # Deduplicate: if both old and new metric names returned data for the same
     # client/timestamp/quantile, keep only one row.
-    if not df.empty:
-        df = df.drop_duplicates(subset=["client", "metric", "quantile", "timestamp"])
+    if table.num_rows:
+        first_rows = (
+            table.append_column("row", pa.array(np.arange(table.num_rows)))
+            .group_by(["client", "metric", "quantile", "timestamp"], use_threads=False)
+            .aggregate([("row", "min")])["row_min"]
+        )
+        table = table.take(np.sort(first_rows.to_numpy()))
     promql = "histogram_quantile(p50/p95/p99, rate(<pq_sig_timing>_bucket[5m]))"
-    return df, promql
+    return table, promql
 
 
 def fetch_network_peers(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch network peer metrics.
 
@@ -400,36 +628,27 @@ def fetch_network_peers(
     - lean_connected_peers
     """
     promql = "lean_connected_peers"
-    result = client.custom_query_range(
-        query=promql,
-        start_time=start_time,
-        end_time=end_time,
-        step="1m",
-    )
+    result = _range_query(client, promql, start_time, end_time, "1m")
 
-    rows = []
+    parts = []
     for series in result:
         metric = series.get("metric", {})
         values = series.get("values", [])
-        for ts, val in values:
-            row = {
-                "client": metric.get("job", "unknown"),
-                "instance": metric.get("instance", "unknown"),
-                "client_type": metric.get("type", "unknown"),
-                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                "value": float(val),
-            }
-            rows.append(row)
+        parts.append(({
+            "client": metric.get("job", "unknown"),
+            "instance": metric.get("instance", "unknown"),
+            "client_type": metric.get("type", "unknown"),
+        }, values))
 
-    df = pd.DataFrame(rows)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_peer_events(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch peer connection and disconnection event counters.
 
@@ -441,39 +660,30 @@ def fetch_peer_events(
         "lean_peer_connection_events_total",
         "lean_peer_disconnection_events_total",
     ]
-    promql = " | ".join(metrics)
-
-    rows = []
-    for metric_name in metrics:
-        result = client.custom_query_range(
-            query=metric_name,
-            start_time=start_time,
-            end_time=end_time,
-            step="1m",
-        )
+    promql = _name_selector(metrics)
+
+    parts = []
+    result = _range_query(client, promql, start_time, end_time, "1m")
+    for series in result:
+        metric = series.get("metric", {})
+        metric_name = metric.get("__name__", "unknown")
         short_name = metric_name.replace("lean_peer_", "").replace("_events_total", "")
-        for series in result:
-            metric = series.get("metric", {})
-            values = series.get("values", [])
-            for ts, val in values:
-                row = {
-                    "client": metric.get("job", "unknown"),
-                    "instance": metric.get("instance", "unknown"),
-                    "metric": short_name,
-                    "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                    "value": float(val),
-                }
-                rows.append(row)
+        values = series.get("values", [])
+        parts.append(({
+            "client": metric.get("job", "unknown"),
+            "instance": metric.get("instance", "unknown"),
+            "metric": short_name,
+        }, values))
 
-    df = pd.DataFrame(rows)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_state_transition_timing(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch state transition timing histograms as percentiles.
 
@@ -489,43 +699,34 @@ def fetch_state_transition_timing(
     ]
     quantiles = [0.5, 0.95, 0.99]
 
-    all_rows = []
-    for metric_base, metric_name in histogram_metrics:
-        for q in quantiles:
-            promql = f'histogram_quantile({q}, rate({metric_base}_bucket[5m]))'
-            try:
-                result = client.custom_query_range(
-                    query=promql,
-                    start_time=start_time,
-                    end_time=end_time,
-                    step="5m",
-                )
-                for series in result:
-                    metric_labels = series.get("metric", {})
-                    values = series.get("values", [])
-                    for ts, val in values:
-                        row = {
-                            "client": metric_labels.get("job", "unknown"),
-                            "instance": metric_labels.get("instance", "unknown"),
-                            "metric": metric_name,
-                            "quantile": q,
-                            "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                            "value": float(val),
-                        }
-                        all_rows.append(row)
-            except Exception:
-                pass
-
-    df = pd.DataFrame(all_rows)
+    # All quantiles of all histograms in one request, told apart by the
+    # metric and quantile labels
+    query = _histogram_quantile_query(quantiles, histogram_metrics)
+    try:
+        result = _range_query(client, query, start_time, end_time, "5m")
+    except Exception:
+        result = []
+
+    parts = []
+    for series in result:
+        metric_labels = series.get("metric", {})
+        parts.append(({
+            "client": metric_labels.get("job", "unknown"),
+            "instance": metric_labels.get("instance", "unknown"),
+            "metric": metric_labels.get("metric", "unknown"),
+            "quantile": float(metric_labels.get("quantile", "nan")),
+        }, series.get("values", [])))
+
+    table = _series_table(parts)
     promql = "histogram_quantile(p50/p95/p99, rate(<state_transition_timing>_bucket[5m]))"
-    return df, promql
+    return table, promql
 
 
 def fetch_validators_count(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch validator count metrics.
 
@@ -533,76 +734,56 @@ def fetch_validators_count(
     - lean_validators_count
     """
     promql = "lean_validators_count"
-    result = client.custom_query_range(
-        query=promql,
-        start_time=start_time,
-        end_time=end_time,
-        step="1m",
-    )
+    result = _range_query(client, promql, start_time, end_time, "1m")
 
-    rows = []
+    parts = []
     for series in result:
         metric = series.get("metric", {})
         values = series.get("values", [])
-        for ts, val in values:
-            row = {
-                "client": metric.get("job", "unknown"),
-                "instance": metric.get("instance", "unknown"),
-                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                "value": float(val),
-            }
-            rows.append(row)
+        parts.append(({
+            "client": metric.get("job", "unknown"),
+            "instance": metric.get("instance", "unknown"),
+        }, values))
 
-    df = pd.DataFrame(rows)
-    return df, promql
+    table = _series_table(parts)
+    return table, promql
 
 
 def fetch_container_cpu(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch CPU usage per container using cAdvisor metrics.
 
     Uses rate() on the counter to get CPU cores used per second.
     """
     promql = "rate(container_cpu_usage_seconds_total[5m])"
-    result = client.custom_query_range(
-        query=promql,
-        start_time=start_time,
-        end_time=end_time,
-        step="5m",
-    )
+    result = _range_query(client, promql, start_time, end_time, "5m")
 
-    rows = []
+    parts = []
     for series in result:
         metric = series.get("metric", {})
         container = metric.get("name", metric.get("container", "unknown"))
         if not container or container in ("", "POD"):
             continue
         values = series.get("values", [])
-        for ts, val in values:
-            val_f = float(val)
-            if val_f != val_f:  # NaN check
-                continue
-            rows.append({
-                "client": metric.get("job", "unknown"),
-                "instance": metric.get("instance", "unknown"),
-                "container": container,
-                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                "value": val_f,
-            })
+        parts.append(({
+            "client": metric.get("job", "unknown"),
+            "instance": metric.get("instance", "unknown"),
+            "container": container,
+        }, values))
 
-    df = pd.DataFrame(rows)
-    return df, promql
+    table = _series_table(parts, drop_nan=True)
+    return table, promql
 
 
 def fetch_container_memory(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch memory usage per container using cAdvisor metrics.
 
@@ -617,49 +798,41 @@ def fetch_container_memory(
         ("container_spec_memory_limit_bytes", "limit"),
     ]
 
-    all_rows = []
-    for promql, metric_name in metrics:
-        try:
-            result = client.custom_query_range(
-                query=promql,
-                start_time=start_time,
-                end_time=end_time,
-                step="1m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                container = metric_labels.get("name", metric_labels.get("container", "unknown"))
-                if not container or container in ("", "POD"):
-                    continue
-                values = series.get("values", [])
-                for ts, val in values:
-                    val_f = float(val)
-                    if val_f != val_f:  # NaN check
-                        continue
-                    # Skip limit=0 (means no limit set)
-                    if metric_name == "limit" and val_f == 0:
-                        continue
-                    all_rows.append({
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "container": container,
-                        "metric": metric_name,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": val_f,
-                    })
-        except Exception:
-            pass
-
-    df = pd.DataFrame(all_rows)
+    parts = []
+    results = _range_query_many(
+        client, [m[0] for m in metrics], start_time, end_time, "1m"
+    )
+    for (_, metric_name), result in zip(metrics, results):
+        for series in result:
+            metric_labels = series.get("metric", {})
+            container = metric_labels.get("name", metric_labels.get("container", "unknown"))
+            if not container or container in ("", "POD"):
+                continue
+            values = series.get("values", [])
+            parts.append(({
+                "client": metric_labels.get("job", "unknown"),
+                "instance": metric_labels.get("instance", "unknown"),
+                "container": container,
+                "metric": metric_name,
+            }, values))
+
+    table = _series_table(parts, drop_nan=True)
+    # Skip limit=0 (means no limit set)
+    if table.num_rows:
+        no_limit = pc.and_(
+            pc.equal(table["metric"].cast(pa.string()), "limit"),
+            pc.equal(table["value"], 0),
+        )
+        table = table.filter(pc.invert(no_limit))
     promql_desc = ", ".join(m[0] for m in metrics)
-    return df, promql_desc
+    return table, promql_desc
 
 
 def fetch_container_disk_io(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch disk I/O per container using cAdvisor metrics.
 
@@ -674,46 +847,34 @@ def fetch_container_disk_io(
         ("container_fs_usage_bytes", "disk_usage", "1m"),
     ]
 
-    all_rows = []
-    for promql, metric_name, step in metrics:
-        try:
-            result = client.custom_query_range(
-                query=promql,
-                start_time=start_time,
-                end_time=end_time,
-                step=step,
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                container = metric_labels.get("name", metric_labels.get("container", "unknown"))
-                if not container or container in ("", "POD"):
-                    continue
-                values = series.get("values", [])
-                for ts, val in values:
-                    val_f = float(val)
-                    if val_f != val_f:  # NaN check
-                        continue
-                    all_rows.append({
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "container": container,
-                        "metric": metric_name,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": val_f,
-                    })
-        except Exception:
-            pass
+    parts = []
+    results = _range_query_many(
+        client, [m[0] for m in metrics], start_time, end_time, [m[2] for m in metrics]
+    )
+    for (_, metric_name, _), result in zip(metrics, results):
+        for series in result:
+            metric_labels = series.get("metric", {})
+            container = metric_labels.get("name", metric_labels.get("container", "unknown"))
+            if not container or container in ("", "POD"):
+                continue
+            values = series.get("values", [])
+            parts.append(({
+                "client": metric_labels.get("job", "unknown"),
+                "instance": metric_labels.get("instance", "unknown"),
+                "container": container,
+                "metric": metric_name,
+            }, values))
 
-    df = pd.DataFrame(all_rows)
+    table = _series_table(parts, drop_nan=True)
     promql_desc = "rate(container_fs_reads_bytes_total[5m]), rate(container_fs_writes_bytes_total[5m]), container_fs_usage_bytes"
-    return df, promql_desc
+    return table, promql_desc
 
 
 def fetch_container_network(
     client: PrometheusConnect,
     start_time: datetime,
     end_time: datetime,
-) -> tuple[pd.DataFrame, str]:
+) -> tuple[pa.Table, str]:
     """
     Fetch network throughput per container using cAdvisor metrics.
 
@@ -726,39 +887,27 @@ def fetch_container_network(
         ("rate(container_network_transmit_bytes_total[5m])", "tx"),
     ]
 
-    all_rows = []
-    for promql, metric_name in metrics:
-        try:
-            result = client.custom_query_range(
-                query=promql,
-                start_time=start_time,
-                end_time=end_time,
-                step="5m",
-            )
-            for series in result:
-                metric_labels = series.get("metric", {})
-                container = metric_labels.get("name", metric_labels.get("container", "unknown"))
-                if not container or container in ("", "POD"):
-                    continue
-                values = series.get("values", [])
-                for ts, val in values:
-                    val_f = float(val)
-                    if val_f != val_f:  # NaN check
-                        continue
-                    all_rows.append({
-                        "client": metric_labels.get("job", "unknown"),
-                        "instance": metric_labels.get("instance", "unknown"),
-                        "container": container,
-                        "metric": metric_name,
-                        "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc),
-                        "value": val_f,
-                    })
-        except Exception:
-            pass
+    parts = []
+    results = _range_query_many(
+        client, [m[0] for m in metrics], start_time, end_time, "5m"
+    )
+    for (_, metric_name), result in zip(metrics, results):
+        for series in result:
+            metric_labels = series.get("metric", {})
+            container = metric_labels.get("name", metric_labels.get("container", "unknown"))
+            if not container or container in ("", "POD"):
+                continue
+            values = series.get("values", [])
+            parts.append(({
+                "client": metric_labels.get("job", "unknown"),
+                "instance": metric_labels.get("instance", "unknown"),
+                "container": container,
+                "metric": metric_name,
+            }, values))
 
-    df = pd.DataFrame(all_rows)
+    table = _series_table(parts, drop_nan=True)
     promql_desc = "rate(container_network_receive_bytes_total[5m]), rate(container_network_transmit_bytes_total[5m])"
-    return df, promql_desc
+    return table, promql_desc
 
 
 # ============================================
@@ -770,6 +919,8 @@ PROMETHEUS_QUERIES = {
         "function": fetch_lean_metrics_overview,
         "description": "Overview of all lean_* metrics availability",
         "output_file": "lean_overview.parquet",
+        # Instant queries at the devnet end; slicing the range makes no sense
+        "time_sliced": False,
     },
     "head_slot": {
         "function": fetch_head_slot,
@@ -844,6 +995,70 @@ PROMETHEUS_QUERIES = {
 }
 
 
+def _output_schema(schema: pa.Schema, promql: str) -> pa.Schema:
+    """Schema written to Parquet for a fetcher's table, with PromQL metadata.
+
+    Dictionary label columns are decoded to plain strings; Parquet
+    dictionary-encodes them on disk anyway, and notebooks expect object
+    columns rather than categoricals.
+    """
+    return pa.schema(
+        [
+            field.with_type(field.type.value_type)
+            if pa.types.is_dictionary(field.type)
+            else field
+            for field in schema
+        ],
+        metadata={**(schema.metadata or {}), b"promql": promql.encode("utf-8")},
+    )
+
+
+# Rows are written sorted by these columns (those present) so label columns
+# form long runs for Parquet's dictionary/RLE encoding and row group min/max
+# statistics stay narrow
+SORT_KEYS = ("metric", "client", "instance", "container", "quantile", "timestamp")
+
+
+def _sort_table(table: pa.Table) -> pa.Table:
+    """Sort a table by the SORT_KEYS columns it has."""
+    keys = [(key, "ascending") for key in SORT_KEYS if key in table.column_names]
+    return table.sort_by(keys) if keys else table
+
+
+def _parquet_options(schema: pa.Schema) -> dict:
+    """Parquet writer options: zstd, with dictionaries for the label columns."""
+    return {
+        "compression": "zstd",
+        "compression_level": 3,
+        "use_dictionary": [
+            field.name for field in schema if pa.types.is_string(field.type)
+        ],
+        "write_statistics": True,
+    }
+
+
+def _client_rename_map(clients: set[str]) -> dict[str, str]:
+    """Map bare client names to their suffixed form.
+
+    During the transition from unsuffixed job labels (e.g., "ream") to
+    suffixed ones ("ream_0"), both may appear in the same time range. Rename
+    bare names to their suffixed counterpart when one exists.
+    """
+    import re
+
+    rename_map = {}
+    suffixed_bases = {}
+    for c in clients:
+        m = re.match(r"^(.+)_(\d+)$", c)
+        if m:
+            suffixed_bases.setdefault(m.group(1), []).append(c)
+    for c in clients:
+        if c in suffixed_bases:
+            # Bare name has suffixed counterparts — merge into _0
+            rename_map[c] = f"{c}_0"
+    return rename_map
+
+
 def fetch_query(
     client: PrometheusConnect,
     query_id: str,
@@ -851,50 +1066,77 @@ def fetch_query(
     start_time: datetime,
     end_time: datetime,
     output_dir: Path,
+    chunk_hours: float = 24,
 ) -> dict:
     """
     Fetch a single query and return metadata.
 
+    The devnet range is fetched in windows of chunk_hours, run concurrently
+    and stitched back together, which keeps each Prometheus response (and its
+    sample count) bounded on long devnets.
+
     Returns dict with fetched_at, row_count, file_size_bytes.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / query_config["output_file"]
 
     fetcher = query_config["function"]
-    df, promql = fetcher(client, start_time, end_time)
-
-    # Normalize client names: during the transition from unsuffixed job labels
-    # (e.g., "ream") to suffixed ones ("ream_0"), both may appear in the same
-    # time range. Rename bare names to their suffixed counterpart when one exists.
-    if "client" in df.columns and not df.empty:
-        import re
-
-        clients = set(df["client"].unique())
-        rename_map = {}
-        suffixed_bases = {}
-        for c in clients:
-            m = re.match(r"^(.+)_(\d+)$", c)
-            if m:
-                suffixed_bases.setdefault(m.group(1), []).append(c)
-        for c in clients:
-            if c in suffixed_bases:
-                # Bare name has suffixed counterparts — merge into _0
-                rename_map[c] = f"{c}_0"
-        if rename_map:
-            df["client"] = df["client"].replace(rename_map)
-
-    # Convert to table and add PromQL metadata
-    table = pa.Table.from_pandas(df, preserve_index=False)
-    existing_metadata = table.schema.metadata or {}
-    new_metadata = {**existing_metadata, b"promql": promql.encode("utf-8")}
-    table = table.replace_schema_metadata(new_metadata)
-
-    pq.write_table(table, output_path)
+    if query_config.get("time_sliced", True):
+        windows = chunked_range(start_time, end_time, timedelta(hours=chunk_hours))
+    else:
+        windows = [(start_time, end_time)]
+    # Windows are fetched concurrently but written in order as they complete,
+    # so only the window tables not yet written are held in memory
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    writer = None
+    row_count = 0
+    clients: set[str] = set()
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for table, promql in pool.map(lambda w: fetcher(client, *w), windows):
+                if not table.num_rows:
+                    continue
+                if writer is None:
+                    schema = _output_schema(table.schema, promql)
+                    writer = pq.ParquetWriter(
+                        tmp_path, schema, **_parquet_options(schema)
+                    )
+                # Sorted per window: windows are consecutive in time, so the
+                # file stays in time order across row groups
+                table = _sort_table(table.cast(schema))
+                writer.write_table(table)
+                row_count += table.num_rows
+                if "client" in table.column_names:
+                    clients.update(pc.unique(table["client"]).to_pylist())
+        if writer is None:
+            pq.write_table(pa.table({}, schema=_output_schema(pa.schema([]), promql)), tmp_path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if writer is not None:
+        writer.close()
+    os.replace(tmp_path, output_path)
+
+    # A bare client name may only turn out to need renaming after its windows
+    # were written; rewrite the file in that (rare) case
+    if rename_map := _client_rename_map(clients):
+        table = pq.read_table(output_path)
+        names = table["client"]
+        for bare, suffixed in rename_map.items():
+            names = pc.if_else(pc.equal(names, bare), suffixed, names)
+        table = table.set_column(
+            table.column_names.index("client"), table.schema.field("client"), names
+        )
+        pq.write_table(
+            _sort_table(table), output_path, **_parquet_options(table.schema)
+        )
 
     return {
         "fetched_at": datetime.now(timezone.utc).isoformat(),
-        "row_count": len(df),
-        "file_size_bytes": output_path.stat().st_size if output_path.exists() else 0,
+        "row_count": row_count,
+        "file_size_bytes": output_path.stat().st_size,
     }
 
 
@@ -903,26 +1145,46 @@ def fetch_devnet(
     devnet: dict,
     output_dir: Path,
     queries_to_run: dict,
+    chunk_hours: float = 24,
 ) -> dict:
     """Fetch all queries for a devnet iteration."""
     devnet_id = devnet["id"]
     start_time, end_time = get_devnet_time_range(devnet)
     devnet_dir = output_dir / devnet_id
 
-    print(f"\n{devnet_id}: {devnet['duration_hours']}h ({start_time.date()} to {end_time.date()})")
+    # Devnets are fetched concurrently, so buffer the log and print it in one
+    # block to keep each devnet's lines together
+    log = [f"\n{devnet_id}: {devnet['duration_hours']}h ({start_time.date()} to {end_time.date()})"]
+
+    # Queries are independent; the HTTP requests they make are bounded by
+    # _in_flight however many run at once
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(
+                fetch_query,
+                client, query_id, query_config, start_time, end_time, devnet_dir,
+                chunk_hours,
+            ): query_id
+            for query_id, query_config in queries_to_run.items()
+        }
+        outcomes = {}
+        for future in as_completed(futures):
+            try:
+                outcomes[futures[future]] = future.result()
+            except Exception as e:
+                outcomes[futures[future]] = e
 
     results = {}
-    for query_id, query_config in queries_to_run.items():
-        print(f"  Fetching {query_id}...")
-        try:
-            metadata = fetch_query(
-                client, query_id, query_config, start_time, end_time, devnet_dir
-            )
-            results[query_id] = metadata
-            print(f"    -> {metadata['row_count']} rows")
-        except Exception as e:
-            print(f"    -> ERROR: {e}")
-
+    for query_id in queries_to_run:
+        log.append(f"  Fetching {query_id}...")
+        outcome = outcomes[query_id]
+        if isinstance(outcome, Exception):
+            log.append(f"    -> ERROR: {outcome}")
+        else:
+            results[query_id] = outcome
+            log.append(f"    -> {outcome['row_count']} rows")
+
+    print("\n".join(log))
     return results
 
 
@@ -974,6 +1236,12 @@ def main() -> None:
     parser.add_argument("--output-dir", default="notebooks/data")
     parser.add_argument("--prometheus-url", help="Prometheus URL (or set PROMETHEUS_URL env)")
     parser.add_argument("--query", help="Fetch specific query only")
+    parser.add_argument(
+        "--query-chunk-hours",
+        type=float,
+        default=24,
+        help="Split each devnet's range into windows of this many hours (default: 24)",
+    )
     parser.add_argument(
         "--list-metrics",
         action="store_true",
@@ -1011,7 +1279,7 @@ def main() -> None:
     if args.list_metrics:
         print(f"Connecting to Prometheus at {client.url}...")
         try:
-            all_metrics = client.all_metrics()
+            all_metrics = _all_metrics(client)
             sorted_metrics = sorted(all_metrics)
 
             # Group by prefix
@@ -1093,16 +1361,29 @@ def main() -> None:
     print(f"Prometheus URL: {client.url}")
     print(f"Fetching {len(devnets_to_fetch)} devnet(s), {len(queries_to_run)} query(s) each")
 
-    # Fetch data for each devnet
+    # Fetch devnets concurrently: the work is I/O-bound on Prometheus, and the
+    # client's session is shared so connections are reused across threads.
+    # Each devnet fans out over its queries too; _in_flight caps the product.
     all_results = {}
-    for devnet in devnets_to_fetch:
-        results = fetch_devnet(client, devnet, output_dir, queries_to_run)
-        all_results[devnet["id"]] = results
+    with ThreadPoolExecutor(max_workers=min(4, len(devnets_to_fetch))) as pool:
+        futures = {
+            pool.submit(
+                fetch_devnet,
+                client, devnet, output_dir, queries_to_run, args.query_chunk_hours,
+            ): devnet["id"]
+            for devnet in devnets_to_fetch
+        }
+        for future in as_completed(futures):
+            all_results[futures[future]] = future.result()
 
     # Update manifest
     print("\nUpdating manifest...")
     update_manifest(output_dir, all_results)
 
+    pruned = prune_prom_cache()
+    if pruned:
+        print(f"Pruned {pruned} stale file(s) from {PROM_CACHE_DIR}")
+
     print("\nDone!")
 
 
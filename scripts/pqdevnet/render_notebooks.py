@@ -2,7 +2,8 @@
 """
 Render Lean Consensus notebooks to HTML.
 
-Executes notebooks with papermill (with devnet_id parameter) and converts to HTML.
+Executes notebooks (with devnet_id parameter) on a kernel shared across the
+notebooks of a devnet and converts to HTML.
 This is the fork-specific rendering script for devnet-based notebooks.
 
 Usage:
@@ -11,39 +12,60 @@ Usage:
     python render_notebooks.py --devnet pqdevnet-005 --notebook 01-pq-signature-performance
 """
 
+from __future__ import annotations
+
 import argparse
+import copy
 import hashlib
+import importlib
 import json
+import os
 import random
 import shutil
 import sys
-import tempfile
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import nbformat
-import papermill as pm
 import yaml
-from nbconvert import HTMLExporter
-from traitlets.config import Config
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# The notebook execution stack (nbclient, nbconvert, papermill) is imported
+# inside the functions that run in render workers, so runs where every
+# notebook is skipped or cached never load it
+if TYPE_CHECKING:
+    import nbformat
+    from nbconvert import HTMLExporter
 
 DATA_ROOT = Path("notebooks/data")
 OUTPUT_DIR = Path("site/rendered")
 MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
 TEMPLATE_DIR = Path("notebooks/templates")
 LEAN_CONFIG_PATH = Path("pqdevnet-pipeline.yaml")
+CACHE_DIR_NAME = ".cache"
+# Unreferenced cache entries are kept this long so that reverting a notebook
+# or data change can reuse the earlier render
+CACHE_RETENTION = timedelta(days=7)
+# Each render worker holds a warm kernel, so the pool stays small
+MAX_WORKERS = 4
+
+# Prepared notebooks per worker process, keyed by (source path, mtime_ns),
+# with the index of their injected setup cell
+_nb_cache: dict[tuple[str, int], tuple[nbformat.NotebookNode, int]] = {}
 
 
 def load_lean_config() -> dict:
     """Load Lean notebooks configuration."""
     if LEAN_CONFIG_PATH.exists():
         with open(LEAN_CONFIG_PATH) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     # Default config if file doesn't exist
     return {
         "notebooks": [
@@ -69,8 +91,7 @@ def load_devnets() -> list[dict]:
 def load_manifest() -> dict:
     """Load existing manifest or return empty structure."""
     if MANIFEST_PATH.exists():
-        with open(MANIFEST_PATH) as f:
-            return json.load(f)
+        return json.loads(MANIFEST_PATH.read_bytes())
     return {"latest_devnet": "", "devnets": {}, "updated_at": ""}
 
 
@@ -78,8 +99,8 @@ def save_manifest(manifest: dict) -> None:
     """Save manifest to disk."""
     manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
     MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(MANIFEST_PATH, "w") as f:
-        json.dump(manifest, f, indent=2)
+    # Serialized in one pass; json.dump would issue a write per token
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
 
 
 def prune_manifest(
@@ -109,23 +130,54 @@ def prune_manifest(
 
 
 def hash_file(path: Path) -> str:
-    """Compute SHA256 hash of a file."""
-    if not path.exists():
+    """Compute SHA256 hash of a file (memoized on path, mtime and size)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return ""
-    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+    return _hash_file_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def _hash_file_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    # Streamed in chunks rather than read into memory whole
+    with open(path_str, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()[:12]
 
 
 def hash_data_dir(devnet_id: str) -> str:
-    """Compute combined hash of all parquet files for a devnet."""
+    """Compute combined hash of all parquet files for a devnet (memoized on their mtimes and sizes)."""
     devnet_dir = DATA_ROOT / devnet_id
     if not devnet_dir.exists():
         return ""
 
-    file_hashes = []
-    for parquet_file in sorted(devnet_dir.glob("*.parquet")):
-        file_hash = hash_file(parquet_file)
-        if file_hash:
-            file_hashes.append(f"{parquet_file.name}:{file_hash}")
+    files = []
+    for entry in _parquet_files(devnet_dir):
+        stat = entry.stat()
+        files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return _hash_data_dir_cached(devnet_id, tuple(files))
+
+
+def _parquet_files(directory: Path) -> list[os.DirEntry]:
+    """Parquet files in a directory, sorted by name."""
+    with os.scandir(directory) as entries:
+        files = [e for e in entries if e.name.endswith(".parquet") and e.is_file()]
+    return sorted(files, key=lambda e: e.name)
+
+
+@lru_cache(maxsize=None)
+def _hash_data_dir_cached(devnet_id: str, files: tuple[tuple[str, int, int], ...]) -> str:
+    devnet_dir = DATA_ROOT / devnet_id
+    names = [name for name, _, _ in files]
+
+    # file_digest releases the GIL, so files are hashed concurrently
+    with ThreadPoolExecutor(max_workers=min(len(names), 8) or 1) as executor:
+        hashes = executor.map(hash_file, [devnet_dir / name for name in names])
+
+        file_hashes = []
+        for name, file_hash in zip(names, hashes):
+            if file_hash:
+                file_hashes.append(f"{name}:{file_hash}")
 
     if not file_hashes:
         return ""
@@ -134,14 +186,102 @@ def hash_data_dir(devnet_id: str) -> str:
     return hashlib.sha256(combined.encode()).hexdigest()[:12]
 
 
+def content_key(devnet_id: str, notebook_hash: str, data_hash: str) -> str:
+    """Key rendered output by its inputs (devnet_id is a notebook parameter)."""
+    return hashlib.sha256(f"{devnet_id}|{notebook_hash}|{data_hash}".encode()).hexdigest()[:16]
+
+
+def _link(src: Path, dst: Path) -> None:
+    """Hard-link src to dst, replacing dst. Copies if linking isn't possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _link_files_dir(src: Path, dst: Path) -> None:
+    """Replace dst with a directory of links to the files in src (if src exists)."""
+    if dst.exists():
+        shutil.rmtree(dst)
+    if src.exists():
+        dst.mkdir(parents=True)
+        for file in src.iterdir():
+            _link(file, dst / file.name)
+
+
+def store_in_cache(output_dir: Path, devnet_id: str, notebook_id: str, key: str) -> None:
+    """Move a rendered notebook into the content cache and hard-link it back."""
+    cache_dir = output_dir / CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    html_file = output_dir / devnet_id / f"{notebook_id}.html"
+    files_dir = output_dir / devnet_id / f"{notebook_id}_files"
+    cached_html = cache_dir / f"{key}.html"
+    cached_files = cache_dir / f"{key}_files"
+
+    os.replace(html_file, cached_html)
+    _link(cached_html, html_file)
+
+    if cached_files.exists():
+        shutil.rmtree(cached_files)
+    if files_dir.exists():
+        os.replace(files_dir, cached_files)
+    _link_files_dir(cached_files, files_dir)
+
+
+def link_from_cache(output_dir: Path, devnet_id: str, notebook_id: str, key: str) -> bool:
+    """Hard-link a cached render into place. Returns False on a cache miss."""
+    cache_dir = output_dir / CACHE_DIR_NAME
+    cached_html = cache_dir / f"{key}.html"
+    if not cached_html.exists():
+        return False
+
+    devnet_output_dir = output_dir / devnet_id
+    devnet_output_dir.mkdir(parents=True, exist_ok=True)
+    _link(cached_html, devnet_output_dir / f"{notebook_id}.html")
+    _link_files_dir(cache_dir / f"{key}_files", devnet_output_dir / f"{notebook_id}_files")
+    # Reset the retention clock
+    os.utime(cached_html)
+    return True
+
+
+def prune_cache(manifest: dict, output_dir: Path) -> int:
+    """
+    Remove cache entries not referenced by the manifest and older than CACHE_RETENTION.
+
+    Returns the number of removed entries.
+    """
+    cache_dir = output_dir / CACHE_DIR_NAME
+    if not cache_dir.exists():
+        return 0
+
+    referenced = {
+        entry.get("content_key")
+        for devnet_entries in manifest.get("devnets", {}).values()
+        for entry in devnet_entries.values()
+    }
+    cutoff = time.time() - CACHE_RETENTION.total_seconds()
+
+    removed = 0
+    for cached_html in cache_dir.glob("*.html"):
+        key = cached_html.stem
+        if key in referenced or cached_html.stat().st_mtime > cutoff:
+            continue
+        cached_html.unlink()
+        shutil.rmtree(cache_dir / f"{key}_files", ignore_errors=True)
+        removed += 1
+    return removed
+
+
 def should_render(
     notebook_id: str,
     notebook_source: Path,
     devnet_id: str,
+    current_data_hash: str,
     manifest: dict,
     force: bool = False,
 ) -> tuple[bool, str]:
-    """Check if a notebook needs to be re-rendered."""
+    """Check if a notebook needs to be re-rendered (current_data_hash from hash_data_dir)."""
     if force:
         return True, "forced"
 
@@ -155,33 +295,181 @@ def should_render(
         return True, "notebook changed"
 
     # Check if data files changed
-    current_data_hash = hash_data_dir(devnet_id)
     if current_data_hash and current_data_hash != existing.get("data_hash"):
         return True, "data changed"
 
     return False, "unchanged"
 
 
-def inject_plotly_renderer(nb: nbformat.NotebookNode) -> nbformat.NotebookNode:
-    """Inject a cell to configure Plotly renderer for HTML export."""
+def manifest_entry(devnet_id: str, item: dict) -> dict:
+    """Build the manifest entry for a rendered (or cache-linked) notebook."""
+    return {
+        "rendered_at": datetime.now(timezone.utc).isoformat(),
+        "notebook_hash": item["notebook_hash"],
+        "data_hash": item["data_hash"],
+        "html_path": f"{devnet_id}/{item['notebook_id']}.html",
+        "content_key": item["content_key"],
+    }
+
+
+def inject_plotly_renderer(
+    nb: nbformat.NotebookNode,
+    insert_idx: int | None = None,
+) -> tuple[nbformat.NotebookNode, int]:
+    """
+    Inject a cell to configure Plotly renderer for HTML export (once).
+
+    The cell goes after the parameters cell. Pass the index returned by an
+    earlier call to skip rescanning the cells' tags; it is kept with the
+    prepared notebook rather than in the notebook's own metadata, which would
+    end up in the executed notebook and its HTML export.
+    """
+    if insert_idx is None:
+        insert_idx = 0
+        for i, cell in enumerate(nb.cells):
+            if cell.cell_type == "code":
+                tags = cell.metadata.get("tags", [])
+                if "parameters" in tags:
+                    insert_idx = i + 1
+                    break
+
+    # Already prepared
+    if insert_idx < len(nb.cells) and "setup" in nb.cells[insert_idx].metadata.get("tags", []):
+        return nb, insert_idx
+
     setup_code = """# Auto-injected: Configure Plotly for HTML export
 import plotly.io as pio
 pio.renderers.default = "notebook"
 """
+    import nbformat
+
     setup_cell = nbformat.v4.new_code_cell(source=setup_code)
     setup_cell.metadata["tags"] = ["setup"]
 
-    # Insert after parameters cell
-    insert_idx = 0
-    for i, cell in enumerate(nb.cells):
-        if cell.cell_type == "code":
-            tags = cell.metadata.get("tags", [])
-            if "parameters" in tags:
-                insert_idx = i + 1
-                break
-
     nb.cells.insert(insert_idx, setup_cell)
-    return nb
+    return nb, insert_idx
+
+
+def load_prepared_notebook(abs_source: Path) -> nbformat.NotebookNode:
+    """
+    Load a notebook (with papermill's cell metadata) and inject Plotly renderer config.
+
+    Each source is parsed once per worker, keyed on its path and mtime; callers
+    get a deep copy since execution mutates the notebook.
+    """
+    from papermill.iorw import load_notebook_node
+
+    key = (str(abs_source), abs_source.stat().st_mtime_ns)
+    if key not in _nb_cache:
+        _nb_cache[key] = inject_plotly_renderer(load_notebook_node(str(abs_source)))
+    return copy.deepcopy(_nb_cache[key][0])
+
+
+def _is_kernel_start_error(error: Exception) -> bool:
+    """Check if an error is a transient kernel startup failure (e.g. ZMQ port race)."""
+    error_str = str(error)
+    return (
+        "ZMQError" in error_str
+        or "Address already in use" in error_str
+        or "Kernel didn't respond" in error_str
+        or "Kernel died" in error_str
+    )
+
+
+class KernelSession:
+    """
+    One IPython kernel shared by several notebook executions.
+
+    Starting a kernel and importing pandas/plotly/pyarrow inside it dominates
+    the cost of a render, so the kernel is started once and its namespace is
+    cleared with %reset before each notebook. Imported modules stay loaded.
+    The kernel is restarted if it dies.
+    """
+
+    def __init__(self, kernel_name: str = "python3"):
+        self.kernel_name = kernel_name
+        self.km = None
+
+    def __enter__(self) -> "KernelSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def start(self, cwd: Path) -> None:
+        """Start the kernel, retrying on ZMQ port collisions."""
+        import nbformat
+        from nbclient import NotebookClient
+
+        max_retries = 3
+        for attempt in range(max_retries):
+            client = NotebookClient(nbformat.v4.new_notebook(), kernel_name=self.kernel_name)
+            self.km = client.create_kernel_manager()
+            try:
+                client.start_new_kernel(cwd=str(cwd))
+                return
+            except Exception as e:
+                self.shutdown()
+                if attempt < max_retries - 1 and _is_kernel_start_error(e):
+                    time.sleep(random.uniform(1, 3))
+                    continue
+                raise
+
+    def shutdown(self) -> None:
+        """Shut down the kernel if one is running."""
+        from jupyter_core.utils import run_sync
+
+        if self.km is not None and self.km.has_kernel:
+            run_sync(self.km.shutdown_kernel)(now=True)
+        self.km = None
+
+    def execute(self, nb: nbformat.NotebookNode, cwd: Path) -> None:
+        """Execute a notebook in place, with cwd as the working directory."""
+        import nbformat
+        from jupyter_core.utils import run_sync
+
+        if self.km is None or not run_sync(self.km.is_alive)():
+            self.shutdown()
+            self.start(cwd)
+
+        reset_cell = nbformat.v4.new_code_cell(
+            source=f"%reset -f\nimport os\nos.chdir({str(cwd)!r})\ndel os"
+        )
+        self._run(nbformat.v4.new_notebook(cells=[reset_cell]))
+        self._run(nb)
+
+    def _run(self, nb: nbformat.NotebookNode) -> None:
+        from nbclient import NotebookClient
+
+        client = NotebookClient(nb, km=self.km, kernel_name=self.kernel_name)
+        try:
+            client.execute()
+        finally:
+            # The kernel outlives the client; only its channels are closed
+            if client.kc is not None:
+                client.kc.stop_channels()
+
+
+@lru_cache(maxsize=1)
+def _get_exporter(template_dir_str: str) -> HTMLExporter:
+    """HTML exporter with the custom template, built once per process (Jinja setup is not free)."""
+    from nbconvert import HTMLExporter
+    from traitlets.config import Config
+
+    c = Config()
+    c.HTMLExporter.extra_template_basedirs = [template_dir_str]
+    c.HTMLExporter.template_name = "minimal"
+    c.HTMLExporter.exclude_input_prompt = True
+    c.HTMLExporter.exclude_output_prompt = True
+    return HTMLExporter(config=c)
+
+
+def _warmup() -> None:
+    """Worker initializer: import the execution stack and build the exporter before the first task."""
+    for module in ("nbclient", "papermill.iorw", "papermill.parameterize"):
+        importlib.import_module(module)
+    exporter = _get_exporter(str(TEMPLATE_DIR.resolve()))
+    exporter.template  # loads and compiles the Jinja template
 
 
 def render_notebook(
@@ -189,8 +477,11 @@ def render_notebook(
     notebook_source: Path,
     devnet_id: str,
     output_dir: Path,
+    session: KernelSession,
 ) -> tuple[bool, str]:
-    """Render a single notebook for a specific devnet using papermill + nbconvert."""
+    """Render a single notebook for a specific devnet on a shared kernel + nbconvert."""
+    from papermill.parameterize import parameterize_notebook
+
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"{notebook_id}.html"
 
@@ -198,72 +489,31 @@ def render_notebook(
     abs_template_dir = TEMPLATE_DIR.resolve()
 
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            executed_nb = tmp_path / f"{notebook_id}_executed.ipynb"
-            prepared_nb = tmp_path / f"{notebook_id}_prepared.ipynb"
-
-            # Read notebook and inject Plotly renderer config
-            with open(abs_source) as f:
-                nb = nbformat.read(f, as_version=4)
-            nb = inject_plotly_renderer(nb)
-
-            # Write prepared notebook
-            with open(prepared_nb, "w") as f:
-                nbformat.write(nb, f)
-
-            # Execute notebook with papermill
-            max_retries = 10
-            last_error = None
-            for attempt in range(max_retries):
-                try:
-                    pm.execute_notebook(
-                        str(prepared_nb),
-                        str(executed_nb),
-                        parameters={"devnet_id": devnet_id},  # Use devnet_id instead of target_date
-                        cwd=str(abs_source.parent),
-                        kernel_name="python3",
-                    )
-                    break
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e)
-                    if attempt < max_retries - 1 and (
-                        "ZMQError" in error_str
-                        or "Address already in use" in error_str
-                        or "Kernel didn't respond" in error_str
-                        or "Kernel died" in error_str
-                    ):
-                        time.sleep(random.uniform(1, 3))
-                        continue
-                    raise
-            else:
-                raise last_error
-
-            # Convert to HTML with custom template
-            c = Config()
-            c.HTMLExporter.extra_template_basedirs = [str(abs_template_dir)]
-            c.HTMLExporter.template_name = "minimal"
-            c.HTMLExporter.exclude_input_prompt = True
-            c.HTMLExporter.exclude_output_prompt = True
-
-            exporter = HTMLExporter(config=c)
-
-            with open(executed_nb) as f:
-                nb = nbformat.read(f, as_version=4)
-
-            html_content, resources = exporter.from_notebook_node(nb)
-
-            with open(output_file, "w") as f:
-                f.write(html_content)
-
-            # Handle extracted resources
-            if resources.get("outputs"):
-                files_dir = output_dir / f"{notebook_id}_files"
-                files_dir.mkdir(exist_ok=True)
-                for filename, data in resources["outputs"].items():
-                    with open(files_dir / filename, "wb") as f:
-                        f.write(data)
+        nb = load_prepared_notebook(abs_source)
+
+        # Inject the devnet_id parameter the same way papermill does
+        nb = parameterize_notebook(nb, {"devnet_id": devnet_id}, kernel_name="python3")
+
+        session.execute(nb, abs_source.parent)
+
+        # Convert to HTML with custom template
+        exporter = _get_exporter(str(abs_template_dir))
+        html_content, resources = exporter.from_notebook_node(nb)
+
+        # Outputs may be hard links into the render cache: replace, never write through
+        output_file.unlink(missing_ok=True)
+        files_dir = output_dir / f"{notebook_id}_files"
+        if files_dir.exists():
+            shutil.rmtree(files_dir)
+
+        # Encoded once and written in a single call (plotly output makes these several MB)
+        output_file.write_bytes(html_content.encode("utf-8"))
+
+        # Handle extracted resources
+        if resources.get("outputs"):
+            files_dir.mkdir()
+            for filename, data in resources["outputs"].items():
+                (files_dir / filename).write_bytes(data)
 
         return True, str(output_file)
 
@@ -271,26 +521,29 @@ def render_notebook(
         return False, str(e)[:500]
 
 
-def render_notebook_task(
-    notebook_id: str,
-    notebook_source_str: str,
-    devnet_id: str,
+def render_notebooks_task(
+    jobs: list[tuple[str, str, str]],
     output_dir_str: str,
-) -> dict:
-    """Worker function for parallel rendering."""
-    notebook_source = Path(notebook_source_str)
+) -> list[dict]:
+    """Worker function: render (devnet_id, notebook_id, source) jobs on one kernel."""
     output_dir = Path(output_dir_str)
 
-    ok, result = render_notebook(notebook_id, notebook_source, devnet_id, output_dir)
-
-    return {
-        "notebook_id": notebook_id,
-        "devnet_id": devnet_id,
-        "success": ok,
-        "result": result,
-        "notebook_hash": hash_file(notebook_source) if ok else "",
-        "data_hash": hash_data_dir(devnet_id) if ok else "",
-    }
+    results = []
+    with KernelSession() as session:
+        for devnet_id, notebook_id, notebook_source_str in jobs:
+            notebook_source = Path(notebook_source_str)
+            ok, result = render_notebook(
+                notebook_id, notebook_source, devnet_id, output_dir / devnet_id, session
+            )
+            results.append(
+                {
+                    "notebook_id": notebook_id,
+                    "devnet_id": devnet_id,
+                    "success": ok,
+                    "result": result,
+                }
+            )
+    return results
 
 
 def main() -> None:
@@ -391,73 +644,105 @@ def main() -> None:
 
     success_count = 0
     skip_count = 0
+    cached_count = 0
     failed = []
 
-    max_workers = min(len(notebooks), 4)
-
+    # Collect (devnet, notebook) pairs that need rendering
+    work = []
     for devnet_id in devnets_with_data:
-        devnet_output_dir = args.output_dir / devnet_id
-
         if devnet_id not in manifest.get("devnets", {}):
             if "devnets" not in manifest:
                 manifest["devnets"] = {}
             manifest["devnets"][devnet_id] = {}
 
-        # Collect notebooks that need rendering
+        # Hashed once per devnet, shared by all of its notebooks
+        data_hash = hash_data_dir(devnet_id)
+
         to_render = []
         for nb in notebooks:
             notebook_id = nb["id"]
             notebook_source = Path(nb["source"])
 
             needs_render, reason = should_render(
-                notebook_id, notebook_source, devnet_id, manifest, args.force
+                notebook_id, notebook_source, devnet_id, data_hash, manifest, args.force
             )
             if not needs_render:
                 print(f"  SKIP: {notebook_id} @ {devnet_id} ({reason})")
                 skip_count += 1
                 continue
 
-            to_render.append((notebook_id, str(notebook_source), reason))
+            notebook_hash = hash_file(notebook_source)
+            item = {
+                "notebook_id": notebook_id,
+                "source": str(notebook_source),
+                "reason": reason,
+                "notebook_hash": notebook_hash,
+                "data_hash": data_hash,
+                "content_key": content_key(devnet_id, notebook_hash, data_hash),
+            }
 
-        if not to_render:
-            continue
+            # The same inputs were rendered before (e.g. a reverted change)
+            if not args.force and link_from_cache(
+                args.output_dir, devnet_id, notebook_id, item["content_key"]
+            ):
+                print(f"  CACHED: {notebook_id} @ {devnet_id} ({reason})")
+                cached_count += 1
+                manifest["devnets"][devnet_id][notebook_id] = manifest_entry(devnet_id, item)
+                continue
 
-        print(f"  Rendering {len(to_render)} notebook(s) @ {devnet_id}...")
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    render_notebook_task,
-                    notebook_id,
-                    notebook_source_str,
-                    devnet_id,
-                    str(devnet_output_dir),
-                ): (notebook_id, reason)
-                for notebook_id, notebook_source_str, reason in to_render
-            }
+            to_render.append(item)
+
+        if to_render:
+            print(f"  Rendering {len(to_render)} notebook(s) @ {devnet_id}...")
+            work.extend((devnet_id, item) for item in to_render)
+
+    if work:
+        # (devnet, notebook) pairs are dealt round-robin into one batch per
+        # worker, so a single devnet still renders in parallel. Each batch
+        # runs serially on its worker's kernel; one kernel start per worker
+        # keeps ZMQ port collisions rare.
+        max_workers = min(len(work), MAX_WORKERS, os.cpu_count() or 1)
+        batches = [work[i::max_workers] for i in range(max_workers)]
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_warmup) as executor:
+            futures = {}
+            for batch in batches:
+                future = executor.submit(
+                    render_notebooks_task,
+                    [
+                        (devnet_id, item["notebook_id"], item["source"])
+                        for devnet_id, item in batch
+                    ],
+                    str(args.output_dir),
+                )
+                futures[future] = {
+                    (devnet_id, item["notebook_id"]): item for devnet_id, item in batch
+                }
 
             for future in as_completed(futures):
-                result = future.result()
-                notebook_id, reason = futures[future]
-
-                if result["success"]:
-                    print(f"    {notebook_id}: OK ({reason})")
-                    success_count += 1
-
-                    html_path = f"{devnet_id}/{notebook_id}.html"
-                    manifest["devnets"][devnet_id][notebook_id] = {
-                        "rendered_at": datetime.now(timezone.utc).isoformat(),
-                        "notebook_hash": result["notebook_hash"],
-                        "data_hash": result["data_hash"],
-                        "html_path": html_path,
-                    }
-                else:
-                    print(f"    {notebook_id}: FAILED")
-                    failed.append((devnet_id, notebook_id, result["result"]))
+                items = futures[future]
+                for result in future.result():
+                    devnet_id = result["devnet_id"]
+                    notebook_id = result["notebook_id"]
+                    item = items[(devnet_id, notebook_id)]
+
+                    if result["success"]:
+                        print(f"    {notebook_id} @ {devnet_id}: OK ({item['reason']})")
+                        success_count += 1
+                        store_in_cache(
+                            args.output_dir, devnet_id, notebook_id, item["content_key"]
+                        )
+                        manifest["devnets"][devnet_id][notebook_id] = manifest_entry(
+                            devnet_id, item
+                        )
+                    else:
+                        print(f"    {notebook_id} @ {devnet_id}: FAILED")
+                        failed.append((devnet_id, notebook_id, result["result"]))
 
     # Prune manifest entries for devnets no longer in devnets.json
     valid_ids = set(available_devnet_ids)
     pruned = prune_manifest(manifest, valid_ids, args.output_dir)
+    prune_cache(manifest, args.output_dir)
 
     # Update latest devnet
     manifest["latest_devnet"] = latest_devnet
@@ -466,7 +751,10 @@ def main() -> None:
     save_manifest(manifest)
 
     print()
-    print(f"Rendered: {success_count}, Skipped: {skip_count}, Failed: {len(failed)}, Pruned: {pruned}")
+    print(
+        f"Rendered: {success_count}, Cached: {cached_count}, Skipped: {skip_count}, "
+        f"Failed: {len(failed)}, Pruned: {pruned}"
+    )
 
     if failed:
         print("\nFailed renders:")
@@ -476,4 +764,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Add parent directory to path for imports (not needed in workers)
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     main()
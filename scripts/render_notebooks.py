@@ -403,18 +403,12 @@ def main() -> None:
     skip_count = 0
     failed = []
 
-    # Use process pool for parallel rendering (one process per notebook)
-    max_workers = min(len(notebooks), 4)  # Cap at 4 to avoid overwhelming system
-
+    # Collect notebooks that need rendering across all dates
+    to_render = []
     for date in dates_to_render:
-        # All dates render to YYYY/MM/DD directory structure
-        date_output_dir = args.output_dir / date_to_path(date)
-
         if date not in manifest["dates"]:
             manifest["dates"][date] = {}
 
-        # Collect notebooks that need rendering for this date
-        to_render = []
         for nb in notebooks:
             notebook_id = nb["id"]
             notebook_source = Path(nb["source"])
@@ -427,13 +421,14 @@ def main() -> None:
                 skip_count += 1
                 continue
 
-            to_render.append((notebook_id, str(notebook_source), nb, reason))
+            to_render.append((notebook_id, str(notebook_source), date, nb, reason))
 
-        if not to_render:
-            continue
+    if to_render:
+        print(f"  Rendering {len(to_render)} notebook(s) in parallel...")
 
-        # Render notebooks in parallel
-        print(f"  Rendering {len(to_render)} notebook(s) @ {date} in parallel...")
+        # One pool for every (date, notebook) pair, so a slow notebook doesn't
+        # hold back the next date. Capped at 4 to avoid overwhelming the system.
+        max_workers = min(len(to_render), 4)
 
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
             futures = {
@@ -442,19 +437,20 @@ def main() -> None:
                     notebook_id,
                     notebook_source_str,
                     date,
-                    str(date_output_dir),
+                    # All dates render to YYYY/MM/DD directory structure
+                    str(args.output_dir / date_to_path(date)),
                     notebook_config,
                     queries_config,
-                ): (notebook_id, reason)
-                for notebook_id, notebook_source_str, notebook_config, reason in to_render
+                ): (notebook_id, date, reason)
+                for notebook_id, notebook_source_str, date, notebook_config, reason in to_render
             }
 
             for future in as_completed(futures):
                 result = future.result()
-                notebook_id, reason = futures[future]
+                notebook_id, date, reason = futures[future]
 
                 if result["success"]:
-                    print(f"    {notebook_id}: OK ({reason})")
+                    print(f"    {notebook_id} @ {date}: OK ({reason})")
                     success_count += 1
 
                     # Update manifest - YYYY/MM/DD path format
@@ -467,7 +463,7 @@ def main() -> None:
                         "html_path": html_path,
                     }
                 else:
-                    print(f"    {notebook_id}: FAILED")
+                    print(f"    {notebook_id} @ {date}: FAILED")
                     failed.append((date, notebook_id, result["result"]))
 
     # Update latest date